@@ -0,0 +1,303 @@
+"""Tests for the Mastodon API client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tests.test_api_models import STATUS
+from tootles.api.client import MastodonAPIError, MastodonClient
+
+
+def make_client(handler):
+    """Create a MastodonClient whose requests are served by `handler`."""
+    client = MastodonClient("https://example.com/", access_token="token")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_favourite_many():
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        status_id = request.url.path.split("/")[-2]
+        return httpx.Response(200, json=dict(STATUS, id=status_id, favourited=True))
+
+    async def run():
+        client = make_client(handler)
+        try:
+            return await client.favourite_many(["1", "2", "3"])
+        finally:
+            await client.close()
+
+    statuses = asyncio.run(run())
+    assert [s.id for s in statuses] == ["1", "2", "3"]
+    assert all(s.favourited for s in statuses)
+    assert sorted(requested) == [
+        "/api/v1/statuses/1/favourite",
+        "/api/v1/statuses/2/favourite",
+        "/api/v1/statuses/3/favourite",
+    ]
+
+
+def test_request_retries_unavailable(monkeypatch):
+    responses = [
+        httpx.Response(503),
+        httpx.Response(502),
+        httpx.Response(200, json=[STATUS]),
+    ]
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    async def run():
+        client = make_client(lambda request: responses.pop(0))
+        try:
+            return await client.get_home_timeline()
+        finally:
+            await client.close()
+
+    statuses = asyncio.run(run())
+    assert [s.id for s in statuses] == ["100"]
+    assert len(delays) == 2
+    assert delays[0] < delays[1]
+
+
+def test_request_post_not_retried(monkeypatch):
+    requests = []
+
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(502)
+
+    async def run():
+        client = make_client(handler)
+        try:
+            await client.favourite_status("100")
+        finally:
+            await client.close()
+
+    # The server may have handled the request before the proxy gave up
+    with pytest.raises(MastodonAPIError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.status_code == 502
+    assert len(requests) == 1
+
+
+def test_post_status_retried_with_idempotency_key(monkeypatch):
+    keys = []
+
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    def handler(request):
+        keys.append(request.headers.get("Idempotency-Key"))
+        if len(keys) == 1:
+            return httpx.Response(504)
+        return httpx.Response(200, json=STATUS)
+
+    async def run():
+        client = make_client(handler)
+        try:
+            return await client.post_status("Hello")
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()).id == "100"
+    assert len(keys) == 2
+    assert keys[0] and keys[0] == keys[1]
+
+
+def test_request_rate_limited(monkeypatch):
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    def handler(request):
+        return httpx.Response(429, json={"error": "Too many requests"}, headers={
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "2999-01-01T00:00:00.000Z",
+        })
+
+    client = make_client(handler)
+
+    async def run():
+        try:
+            await client.favourite_status("100")
+        finally:
+            await client.close()
+
+    # Reset is too far in the future to wait for, so the error is raised
+    with pytest.raises(MastodonAPIError) as excinfo:
+        asyncio.run(run())
+
+    assert excinfo.value.status_code == 429
+    assert str(excinfo.value) == "Too many requests"
+    assert client.rate_limit_remaining == 0
+
+
+def test_get_home_timeline():
+    def handler(request):
+        assert request.url.path == "/api/v1/timelines/home"
+        assert request.url.params["limit"] == "40"
+        link = (
+            '<https://example.com/api/v1/timelines/home?max_id=99>; rel="next", '
+            '<https://example.com/api/v1/timelines/home?min_id=100>; rel="prev"'
+        )
+        return httpx.Response(200, json=[STATUS, dict(STATUS, id="99")], headers={"Link": link})
+
+    async def run():
+        client = make_client(handler)
+        try:
+            return await client.get_home_timeline(limit=100)
+        finally:
+            await client.close()
+
+    statuses = asyncio.run(run())
+    assert [s.id for s in statuses] == ["100", "99"]
+    assert statuses.links == {
+        "next": "https://example.com/api/v1/timelines/home?max_id=99",
+        "prev": "https://example.com/api/v1/timelines/home?min_id=100",
+    }
+
+
+def test_post_status():
+    def handler(request):
+        assert request.method == "POST"
+        assert request.headers["Content-Type"] == "application/json"
+        body = json.loads(request.content)
+        assert body == {"status": "Hello", "visibility": "unlisted", "sensitive": False}
+        return httpx.Response(200, json=dict(STATUS, visibility="unlisted"))
+
+    async def run():
+        client = make_client(handler)
+        try:
+            return await client.post_status("Hello", visibility="unlisted")
+        finally:
+            await client.close()
+
+    status = asyncio.run(run())
+    assert status.visibility == "unlisted"
+
+
+def test_get_notifications_params():
+    def handler(request):
+        params = request.url.params
+        assert params["limit"] == "1"
+        assert params["max_id"] == "50"
+        assert "since_id" not in params
+        assert params.get_list("exclude_types[]") == ["follow", "mention"]
+        return httpx.Response(200, json=[])
+
+    async def run():
+        client = make_client(handler)
+        try:
+            return await client.get_notifications(
+                max_id="50", limit=0, exclude_types=["follow", "mention"]
+            )
+        finally:
+            await client.close()
+
+    assert asyncio.run(run()) == []
+
+
+def test_shared_client():
+    async def run():
+        first = MastodonClient("https://example.com", access_token="one")
+        second = MastodonClient("https://example.com/", access_token="two")
+        other = MastodonClient("https://example.org")
+        try:
+            await first._ensure_client()
+            await second._ensure_client()
+            await other._ensure_client()
+            assert first._client is second._client
+            assert first._client is not other._client
+
+            # Credentials are per client, not on the shared HTTP client
+            assert "Authorization" not in first._client.headers
+            assert first._headers["Authorization"] == "Bearer one"
+            assert second._headers["Authorization"] == "Bearer two"
+            assert other._headers == {}
+        finally:
+            await MastodonClient.close_all()
+
+        assert first._client.is_closed
+        assert MastodonClient._shared_clients == {}
+
+        # Clients keep working after the shared clients were closed
+        try:
+            await first._ensure_client()
+            assert not first._client.is_closed
+        finally:
+            await MastodonClient.close_all()
+
+    asyncio.run(run())
+
+
+def test_shared_client_released():
+    async def run():
+        async with MastodonClient("https://example.com") as first:
+            async with MastodonClient("https://example.com") as second:
+                client = first._client
+                assert second._client is client
+            # Still in use by the first client
+            assert not client.is_closed
+        assert client.is_closed
+        assert MastodonClient._shared_clients == {}
+        return client
+
+    # Each event loop gets a client of its own
+    assert asyncio.run(run()) is not asyncio.run(run())
+
+
+def test_shared_client_per_loop():
+    client = MastodonClient("https://example.com")
+
+    async def run():
+        await client._ensure_client()
+        return client._client
+
+    try:
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+        assert second is not first
+        assert list(MastodonClient._shared_clients.values()) == [second]
+    finally:
+        asyncio.run(MastodonClient.close_all())
+
+
+def test_request_error_message():
+    def handler(request):
+        if request.url.path.endswith("/1/favourite"):
+            return httpx.Response(404, json={"error": "Record not found"})
+        return httpx.Response(422, content=b"Unprocessable")
+
+    async def run():
+        client = make_client(handler)
+        errors = []
+        for status_id in ("1", "2"):
+            try:
+                await client.favourite_status(status_id)
+            except MastodonAPIError as e:
+                errors.append((str(e), e.status_code))
+        await client.close()
+        return errors
+
+    assert asyncio.run(run()) == [
+        ("Record not found", 404),
+        ("HTTP 422: Unprocessable", 422),
+    ]
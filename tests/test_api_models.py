@@ -0,0 +1,103 @@
+"""Tests for Mastodon API data models."""
+
+from datetime import datetime, timezone
+
+from tootles.api.models import Account, Notification, Status
+
+ACCOUNT = {
+    "id": "1",
+    "username": "frank",
+    "acct": "frank@example.com",
+    "display_name": "Frank Zappa",
+    "locked": False,
+    "bot": False,
+    "group": False,
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "note": "",
+    "url": "https://example.com/@frank",
+    "avatar": "https://example.com/avatar.png",
+    "avatar_static": "https://example.com/avatar.png",
+    "header": "https://example.com/header.png",
+    "header_static": "https://example.com/header.png",
+    "followers_count": 1,
+    "following_count": 2,
+    "statuses_count": 3,
+    "last_status_at": "2024-01-02",
+    "emojis": [],
+    "fields": [],
+}
+
+STATUS = {
+    "id": "100",
+    "uri": "https://example.com/statuses/100",
+    "created_at": "2024-01-03T12:30:00.000Z",
+    "account": ACCOUNT,
+    "content": "<p>Hello</p>",
+    "visibility": "public",
+    "sensitive": False,
+    "spoiler_text": "",
+    "media_attachments": [{
+        "id": "5",
+        "type": "image",
+        "url": "https://example.com/image.png",
+        "preview_url": "https://example.com/preview.png",
+        "meta": {},
+    }],
+    "mentions": [],
+    "tags": [],
+    "emojis": [],
+    "reblogs_count": 0,
+    "favourites_count": 4,
+    "replies_count": 0,
+    "favourited": True,
+}
+
+
+def test_account_from_dict():
+    account = Account.from_dict(ACCOUNT)
+    assert account.acct == "frank@example.com"
+    assert account.created_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert account.last_status_at == datetime(2024, 1, 2)
+    assert account.discoverable is None
+
+
+def test_status_from_dict():
+    status = Status.from_dict(STATUS)
+    assert status.id == "100"
+    assert status.created_at == datetime(2024, 1, 3, 12, 30, tzinfo=timezone.utc)
+    assert status.account.username == "frank"
+    assert status.media_attachments[0].preview_url == "https://example.com/preview.png"
+    assert status.media_attachments[0].description is None
+    assert status.favourited is True
+    assert status.bookmarked is False
+    assert status.reblog is None
+
+
+def test_status_from_dict_reblog():
+    data = dict(STATUS, id="101", reblog=STATUS)
+    status = Status.from_dict(data)
+    assert status.id == "101"
+    assert status.reblog.id == "100"
+    assert status.reblog.account.username == "frank"
+
+
+def test_notification_from_dict():
+    data = {
+        "id": "7",
+        "type": "favourite",
+        "created_at": "2024-01-04T00:00:00Z",
+        "account": ACCOUNT,
+        "status": STATUS,
+    }
+    notification = Notification.from_dict(data)
+    assert notification.created_at == datetime(2024, 1, 4, tzinfo=timezone.utc)
+    assert notification.status.id == "100"
+
+    notification = Notification.from_dict(dict(data, type="follow", status=None))
+    assert notification.status is None
+
+
+def test_status_from_list_shares_accounts():
+    statuses = Status.from_list([STATUS, dict(STATUS, id="101", reblog=STATUS)])
+    assert statuses[0].account is statuses[1].account
+    assert statuses[1].reblog.account is statuses[0].account
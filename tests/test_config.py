@@ -1,7 +1,6 @@
 """Tests for configuration management."""
 
-import tempfile
-from pathlib import Path
+import os
 
 import pytest
 
@@ -12,7 +11,7 @@ from tootles.config.schema import TootlesConfig
 def test_config_creation():
     """Test basic config creation."""
     config = TootlesConfig()
-    assert config.theme == "default"
+    assert config.theme == "standard"
     assert config.auto_refresh is True
     assert config.refresh_interval == 60
 
@@ -28,20 +27,57 @@ def test_config_validation():
         config.validate()
 
 
-def test_config_manager():
+def test_config_manager(tmp_path):
     """Test config manager basic functionality."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        config_path = Path(temp_dir) / "config.toml"
-        manager = ConfigManager(config_path)
+    config_path = tmp_path / "tootles" / "config.toml"
+    manager = ConfigManager(config_path)
 
-        # Should create default config
-        config = manager.config
-        assert isinstance(config, TootlesConfig)
-        assert config.theme == "default"
+    # Should create default config, without writing it yet
+    config = manager.config
+    assert isinstance(config, TootlesConfig)
+    assert config.theme == "standard"
+    assert not config_path.exists()
 
-        # Should save and reload config
-        config.theme = "dark"
-        manager.save()
+    # Should save and reload config
+    config.theme = "dark"
+    manager.save()
+    assert config_path.exists()
 
-        manager.reload()
-        assert manager.config.theme == "dark"
+    manager.reload()
+    assert manager.config.theme == "dark"
+
+
+def test_config_manager_reload_changed_file(tmp_path):
+    """Test that reload picks up changes made to the file."""
+    config_path = tmp_path / "config.toml"
+    manager = ConfigManager(config_path)
+    manager.save()
+    config = manager.config
+
+    # Unchanged file is not parsed again
+    manager.reload()
+    assert manager.config is config
+
+    stat = config_path.stat()
+    config_path.write_text('theme = "light"\n', encoding="utf-8")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    manager.reload()
+    assert manager.config is not config
+    assert manager.config.theme == "light"
+
+
+def test_config_manager_save_after_external_edit(tmp_path):
+    """Test that save writes the config back over an edited file."""
+    config_path = tmp_path / "config.toml"
+    manager = ConfigManager(config_path)
+    manager.config.theme = "dark"
+    manager.save()
+
+    stat = config_path.stat()
+    config_path.write_text('theme = "light"\n', encoding="utf-8")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # The in-memory config is unchanged, but no longer matches the file
+    manager.save()
+    assert 'theme = "dark"' in config_path.read_text(encoding="utf-8")
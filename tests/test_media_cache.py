@@ -0,0 +1,179 @@
+"""Tests for the media cache."""
+
+import asyncio
+import os
+
+from tootles.media.cache import DiskCache, MediaCache, MemoryCache
+
+MB = 1024 * 1024
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=1)
+    for key in "abcdefgh":
+        cache.set(key, b"x" * (MB // 8))
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.set("i", b"x" * (MB // 8))
+
+    assert list(cache.cache) == list("cdefghai")
+    assert cache.current_size == MB
+
+
+def test_memory_cache_replace():
+    cache = MemoryCache(maxsize=1)
+    cache.set("a", b"12")
+    cache.set("a", b"123")
+
+    assert cache.get("a") == b"123"
+    assert cache.current_size == 3
+
+
+def test_memory_cache_too_large():
+    cache = MemoryCache(maxsize=1)
+    cache.set("a", b"a")
+    cache.set("b", b"b" * (MB // 8 + 1))
+
+    # Too large items are not cached, and don't evict others
+    assert cache.get("b") is None
+    assert cache.get("a") == b"a"
+
+
+def test_disk_cache_evicts_oldest(tmp_path):
+    cache = DiskCache(str(tmp_path), max_size_mb=1)
+
+    async def run():
+        await cache.set("a", b"a" * (MB // 2))
+        await cache.set("b", b"b" * (MB // 4))
+        await cache.set("b", b"b" * (MB // 4))  # replacing doesn't add up
+        assert await cache._get_cache_size() == MB // 2 + MB // 4
+
+        # Make "a" the least recently accessed file
+        path = cache._get_cache_path("a")
+        os.utime(path, (0, path.stat().st_mtime))
+        await cache.set("c", b"c" * (MB // 2))
+        await cache._cleanup_task  # cleanup runs in the background
+        return [await cache.get(key) is not None for key in "abc"]
+
+    assert asyncio.run(run()) == [False, True, True]
+    assert cache._current_size == MB // 4 + MB // 2
+
+
+def test_media_cache_fetch_coalesced(tmp_path):
+    cache = MediaCache(cache_dir=str(tmp_path))
+    fetched = []
+
+    async def fetch(url):
+        fetched.append(url)
+        await asyncio.sleep(0.01)
+        yield b"da"
+        yield b"ta"
+
+    async def run():
+        results = await asyncio.gather(
+            *(cache.fetch_full_media("https://example.com/a.png", fetch) for _ in range(3))
+        )
+        return results, await cache.get_full_media("https://example.com/a.png")
+
+    results, cached = asyncio.run(run())
+    assert results == [b"data"] * 3
+    assert cached == b"data"
+    assert fetched == ["https://example.com/a.png"]
+    assert cache._inflight == {}
+
+
+def test_media_cache_fetch_large_to_disk(tmp_path):
+    cache = MediaCache(cache_dir=str(tmp_path))
+    chunk = b"x" * (MB // 4)
+
+    async def fetch(url):
+        for _ in range(6):
+            yield chunk
+
+    async def run():
+        data = await cache.fetch_full_media("https://example.com/a.mp4", fetch)
+        return data, await cache.disk_cache.get("https://example.com/a.mp4")
+
+    data, cached = asyncio.run(run())
+    assert data == chunk * 6
+    assert cached == data
+    assert cache.memory_cache.get("https://example.com/a.mp4") is None
+    assert [path.suffix for path in tmp_path.iterdir()] == [".cache"]
+
+
+def test_media_cache_fetch_large_without_cache_dir(tmp_path):
+    cache = MediaCache(cache_dir=str(tmp_path / "cache"))
+    (tmp_path / "cache").rmdir()
+    chunk = b"x" * (MB // 4)
+
+    async def fetch(url):
+        for _ in range(6):
+            yield chunk
+
+    # The download is still returned when the cache file can't be created
+    data = asyncio.run(cache.fetch_full_media("https://example.com/a.mp4", fetch))
+    assert data == chunk * 6
+
+
+def test_media_cache_store_over_memory_item_cap(tmp_path):
+    # The memory tier only takes items up to 7/8 MB here
+    cache = MediaCache(memory_cache_mb=8, cache_dir=str(tmp_path))
+    data = b"x" * (MB * 15 // 16)
+
+    async def run():
+        await cache.store_full_media("https://example.com/a.png", data)
+        return await cache.get_full_media("https://example.com/a.png")
+
+    assert asyncio.run(run()) == data
+    assert cache.memory_cache.get("https://example.com/a.png") is None
+
+
+def test_disk_cache_clear(tmp_path):
+    cache = DiskCache(str(tmp_path), max_size_mb=1)
+    (tmp_path / "other.txt").write_bytes(b"other")
+
+    async def run():
+        await cache.set("a", b"a")
+        await cache.set("b", b"b")
+        await cache.clear()
+        return await cache.get("a")
+
+    assert asyncio.run(run()) is None
+    assert cache._current_size == 0
+    assert [path.name for path in tmp_path.iterdir()] == ["other.txt"]
+
+
+def test_disk_cache_keeps_recently_read(tmp_path):
+    cache = DiskCache(str(tmp_path), max_size_mb=1)
+
+    async def run():
+        await cache.set("a", b"a" * (MB // 2))
+        await cache.set("b", b"b" * (MB // 4))
+        # A read keeps "a", even with the oldest access time on disk
+        assert await cache.get("a") is not None
+        path = cache._get_cache_path("a")
+        os.utime(path, (0, path.stat().st_mtime))
+        await cache.set("c", b"c" * (MB // 4 + 1))
+        await cache._cleanup_task
+        return [await cache.get(key) is not None for key in "abc"]
+
+    assert asyncio.run(run()) == [True, False, True]
+
+
+def test_disk_cache_cleanup_failure_logged(tmp_path, caplog):
+    cache = DiskCache(str(tmp_path), max_size_mb=1)
+
+    def fail(*args):
+        raise OSError("disk on fire")
+
+    cache._remove_least_recent = fail
+
+    async def run():
+        await cache.set("a", b"a" * (MB + 1))
+        task = cache._cleanup_task
+        await asyncio.wait([task])
+        return task
+
+    task = asyncio.run(run())
+    assert isinstance(task.exception(), OSError)
+    assert cache._cleanup_task is None
+    assert "Disk cache cleanup failed: disk on fire" in caplog.text
@@ -0,0 +1,61 @@
+"""Tests for the media loader."""
+
+import asyncio
+import io
+
+import httpx
+from PIL import Image
+
+from tootles.media.cache import MediaCache
+from tootles.media.loader import MediaLoader
+
+
+def _png(width, height):
+    output = io.BytesIO()
+    Image.new("RGB", (width, height)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def test_load_thumbnail_shared(tmp_path):
+    requests = []
+    image = _png(600, 300)
+
+    def handler(request):
+        requests.append(request.url)
+        return httpx.Response(200, content=image)
+
+    loader = MediaLoader(MediaCache(cache_dir=str(tmp_path)))
+    loader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        return await asyncio.gather(
+            *(loader.load_thumbnail("https://example.com/a.png") for _ in range(3))
+        )
+
+    thumbnails = asyncio.run(run())
+    assert len(requests) == 1
+    assert thumbnails[0] is not None
+    assert thumbnails == [thumbnails[0]] * 3
+    assert Image.open(io.BytesIO(thumbnails[0])).size == (150, 75)
+    assert loader._thumbnail_tasks == {}
+
+
+def test_load_thumbnail_attachment_type(tmp_path):
+    image = _png(100, 100)
+
+    def handler(request):
+        return httpx.Response(200, content=image)
+
+    loader = MediaLoader(MediaCache(cache_dir=str(tmp_path)))
+    loader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def run():
+        # The URL has no extension, the attachment type says it is an image
+        return (
+            await loader.load_thumbnail("https://example.com/media/1"),
+            await loader.load_thumbnail("https://example.com/media/1", mimetype="image"),
+        )
+
+    unknown, thumbnail = asyncio.run(run())
+    assert unknown is None
+    assert thumbnail is not None
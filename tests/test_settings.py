@@ -0,0 +1,22 @@
+from toot.settings import _get_setting
+
+
+def test_get_setting():
+    settings = {
+        "common": {"color": False},
+        "commands": {"post": {"editor": "vim", "visibility": 1}},
+    }
+
+    assert _get_setting(settings, ["common", "color"], bool) is False
+    assert _get_setting(settings, ["commands", "post", "editor"], str) == "vim"
+    assert _get_setting(settings, ["commands", "post"], dict) == {"editor": "vim", "visibility": 1}
+
+    # Missing keys fall back to default
+    assert _get_setting(settings, ["commands", "read", "editor"], str) is None
+    assert _get_setting(settings, ["commands", "read", "editor"], str, "nano") == "nano"
+
+    # Walking into a non-dict value falls back to default
+    assert _get_setting(settings, ["commands", "post", "editor", "x"], str, "nano") == "nano"
+
+    # Values of the wrong type fall back to default
+    assert _get_setting(settings, ["commands", "post", "visibility"], str, "public") == "public"
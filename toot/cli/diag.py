@@ -18,7 +18,7 @@ DIAG_DEPENDENCIES = [
     "requests",
     "setuptools",
     "term-image",
-    "tomlkit",
+    "tomli",
     "typing-extensions",
     "urwid",
     "urwidgets",
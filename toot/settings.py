@@ -1,8 +1,11 @@
 from functools import lru_cache
-from os.path import exists, join
+from os.path import join
 from typing import Optional, Type, TypeVar
 
-from tomlkit import parse
+try:
+    import tomllib  # novermin
+except ImportError:
+    import tomli as tomllib
 
 from toot import get_config_dir
 
@@ -20,18 +23,21 @@ def _load_settings() -> dict:
     if DISABLE_SETTINGS:
         return {}
 
-    path = get_settings_path()
-
-    if not exists(path):
+    try:
+        with open(get_settings_path(), "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
         return {}
 
-    with open(path) as f:
-        return parse(f.read())
 
+_SETTINGS: Optional[dict] = None
 
-@lru_cache(maxsize=None)
-def get_settings():
-    return _load_settings()
+
+def get_settings() -> dict:
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = _load_settings()
+    return _SETTINGS
 
 
 T = TypeVar("T")
@@ -44,19 +50,22 @@ def get_setting(key: str, type: Type[T], default: Optional[T] = None) -> Optiona
     inside the `[commands.post]` section.
     """
     settings = get_settings()
-    return _get_setting(settings, key.split("."), type, default)
+    return _get_setting(settings, _split_key(key), type, default)
+
+
+@lru_cache(maxsize=None)
+def _split_key(key: str):
+    return tuple(key.split("."))
 
 
 def _get_setting(dct, keys, type: Type, default=None):
-    if len(keys) == 0:
-        if isinstance(dct, type):
-            return dct
-        else:
-            # TODO: warn? cast? both?
+    for key in keys:
+        if not isinstance(dct, dict) or key not in dct:
             return default
+        dct = dct[key]
 
-    key = keys[0]
-    if isinstance(dct, dict) and key in dct:
-        return _get_setting(dct[key], keys[1:], type, default)
+    if isinstance(dct, type):
+        return dct
 
+    # TODO: warn? cast? both?
     return default
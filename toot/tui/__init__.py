@@ -1,15 +1,20 @@
-from urwid.command_map import (
-    CURSOR_DOWN,
-    CURSOR_LEFT,
-    CURSOR_RIGHT,
-    CURSOR_UP,
-    command_map,
-)
+def install_vi_keys():
+    """Add movement using h/j/k/l to the default urwid command map.
 
-# Add movement using h/j/k/l to default command map
-command_map._command.update({
-    'k': CURSOR_UP,
-    'j': CURSOR_DOWN,
-    'h': CURSOR_LEFT,
-    'l': CURSOR_RIGHT,
-})
+    Called when the TUI starts rather than on import, so that commands which
+    only need e.g. `toot.tui.constants` don't pull in urwid.
+    """
+    from urwid.command_map import (
+        CURSOR_DOWN,
+        CURSOR_LEFT,
+        CURSOR_RIGHT,
+        CURSOR_UP,
+        command_map,
+    )
+
+    command_map._command.update({
+        'k': CURSOR_UP,
+        'j': CURSOR_DOWN,
+        'h': CURSOR_LEFT,
+        'l': CURSOR_RIGHT,
+    })
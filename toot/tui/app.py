@@ -10,6 +10,7 @@ from toot import App, User, __version__, api, config, settings
 from toot.cli import get_default_visibility
 from toot.utils.datetime import parse_datetime
 
+from . import install_vi_keys
 from .compose import StatusComposer
 from .constants import PALETTE
 from .entities import Status
@@ -105,6 +106,8 @@ class TUI(urwid.Frame):
     @staticmethod
     def create(app: App, user: User, options: TuiOptions):
         """Factory method, sets up TUI and an event loop."""
+        install_vi_keys()
+
         screen = TuiScreen()
         screen.set_terminal_properties(options.colors)
 
@@ -7,6 +7,9 @@ from .widgets import Button, EditBox
 
 logger = logging.getLogger(__name__)
 
+# Position of each visibility option in the visibility chooser
+VISIBILITY_FOCUS_MAP = {v[0]: n + 1 for n, v in enumerate(VISIBILITY_OPTIONS)}
+
 
 class StatusComposer(urwid.Frame):
     """
@@ -28,6 +31,8 @@ class StatusComposer(urwid.Frame):
         self.edit = edit
 
         self.cw_edit = None
+        self.cw_label = urwid.Text("Content warning")
+        self.cw_divider = urwid.Divider()
         self.cw_add_button = Button("Add content warning",
             on_press=self.add_content_warning)
         self.cw_remove_button = Button("Remove content warning",
@@ -56,9 +61,11 @@ class StatusComposer(urwid.Frame):
         urwid.connect_signal(self.content_edit.edit, "change", self.text_changed)
 
         self.char_count = urwid.Text([f"0/{max_chars}"])
+        self.last_count = None
 
         self.visibility_button = Button(f"Visibility: {self.visibility}",
             on_press=self.choose_visibility)
+        self.visibility_walker = None  # built on first use
 
         self.post_button = Button("Edit" if edit else "Post", on_press=self.post)
         self.cancel_button = Button("Cancel", on_press=self.close)
@@ -73,14 +80,20 @@ class StatusComposer(urwid.Frame):
             return ""
 
         text = '' if in_reply_to.is_mine else f'@{in_reply_to.original.account} '
-        mentions = ['@{}'.format(m["acct"]) for m in in_reply_to.mentions if m["acct"] != self.username]
+        mentions = ' '.join(f'@{m["acct"]}' for m in in_reply_to.mentions if m["acct"] != self.username)
         if mentions:
-            text += '\n\n{}'.format(' '.join(mentions))
+            text += f'\n\n{mentions}'
 
         return text
 
     def text_changed(self, edit, text):
         count = self.max_chars - len(text)
+
+        # Skip the redraw if the displayed count is unchanged
+        if count == self.last_count:
+            return
+        self.last_count = count
+
         text = f"{count}/{self.max_chars}"
         color = "warning" if count < 0 else ""
         self.char_count.set_text((color, text))
@@ -96,10 +109,7 @@ class StatusComposer(urwid.Frame):
         yield urwid.Divider()
 
         if self.cw_edit:
-            yield urwid.Text("Content warning")
-            yield self.cw_edit
-            yield urwid.Divider()
-            yield self.cw_remove_button
+            yield from self.content_warning_items()
         else:
             yield self.cw_add_button
 
@@ -107,40 +117,45 @@ class StatusComposer(urwid.Frame):
         yield self.post_button
         yield self.cancel_button
 
-    def refresh(self):
-        self.walker = urwid.SimpleListWalker(list(self.generate_list_items()))
-        self.listbox.body = self.walker
+    def content_warning_items(self):
+        return [self.cw_label, self.cw_edit, self.cw_divider, self.cw_remove_button]
 
     def choose_visibility(self, *args):
-        list_items = [urwid.Text("Choose status visibility:")]
-        for visibility, caption, description in VISIBILITY_OPTIONS:
-            text = f"{caption} - {description}"
-            button = Button(text, on_press=self.set_visibility, user_data=visibility)
-            list_items.append(button)
+        # Show the options in a separate walker, leaving the form intact
+        if self.visibility_walker is None:
+            list_items = [urwid.Text("Choose status visibility:")]
+            for visibility, caption, description in VISIBILITY_OPTIONS:
+                text = f"{caption} - {description}"
+                button = Button(text, on_press=self.set_visibility, user_data=visibility)
+                list_items.append(button)
+            self.visibility_walker = urwid.SimpleListWalker(list_items)
 
-        self.walker = urwid.SimpleListWalker(list_items)
-        self.listbox.body = self.walker
+        self.listbox.body = self.visibility_walker
 
         # Initially focus currently chosen visibility
-        focus_map = {v[0]: n + 1 for n, v in enumerate(VISIBILITY_OPTIONS)}
-        focus = focus_map.get(self.visibility, 1)
-        self.walker.set_focus(focus)
+        focus = VISIBILITY_FOCUS_MAP.get(self.visibility, 1)
+        self.visibility_walker.set_focus(focus)
 
     def set_visibility(self, widget, visibility):
         self.visibility = visibility
         self.visibility_button.set_label(f"Visibility: {self.visibility}")
-        self.refresh()
-        self.walker.set_focus(7 if self.cw_edit else 4)
+        self.listbox.body = self.walker
+        self.walker.set_focus(self.walker.index(self.visibility_button))
 
     def add_content_warning(self, button):
         self.cw_edit = EditBox(multiline=True, allow_tab=True)
-        self.refresh()
-        self.walker.set_focus(4)
+
+        # Replace the "add" button with the content warning rows
+        position = self.walker.index(self.cw_add_button)
+        self.walker[position:position + 1] = self.content_warning_items()
+        self.walker.set_focus(self.walker.index(self.cw_edit))
 
     def remove_content_warning(self, button):
+        # Replace the content warning rows with the "add" button
+        position = self.walker.index(self.cw_label)
+        self.walker[position:position + 4] = [self.cw_add_button]
+        self.walker.set_focus(position)
         self.cw_edit = None
-        self.refresh()
-        self.walker.set_focus(3)
 
     def set_error_message(self, msg):
         self.footer = urwid.Text(("footer_message_error", msg))
@@ -151,13 +166,10 @@ class StatusComposer(urwid.Frame):
     def post(self, button):
         self.clear_error_message()
 
-        # Don't lstrip content to avoid removing intentional leading whitespace
-        # However, do strip both sides to check if there is any content there
-        content = self.content_edit.edit_text.rstrip()
-        content = None if not content.strip() else content
-
-        warning = self.cw_edit.edit_text.rstrip() if self.cw_edit else ""
-        warning = None if not warning.strip() else warning
+        # Don't lstrip content to avoid removing intentional leading whitespace.
+        # A whitespace-only text is empty after rstrip, so no need to strip again.
+        content = self.content_edit.edit_text.rstrip() or None
+        warning = (self.cw_edit.edit_text.rstrip() if self.cw_edit else "") or None
 
         if not content:
             self.set_error_message("Cannot post an empty message")
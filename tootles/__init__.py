@@ -1,5 +1,24 @@
 """Tootles - Modern Textual-based Mastodon client."""
 
+from tootles._lazy import lazy_exports
+
 __version__ = "0.1.0"
 __author__ = "Tootles Contributors"
 __email__ = "contributors@tootles.dev"
+
+# Public names are resolved on first access (PEP 562) so that `import tootles`
+# does not pull in textual, httpx and the whole widget/screen tree.
+_LAZY = {
+    "TootlesApp": ".main",
+    "main": ".main",
+    "ConfigManager": ".config.manager",
+    "TootlesConfig": ".config.schema",
+    "MediaConfig": ".config.schema",
+    "MastodonClient": ".api.client",
+    "MediaManager": ".media.manager",
+    "ThemeManager": ".themes.manager",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
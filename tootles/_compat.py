@@ -0,0 +1,29 @@
+"""Compatibility helpers for older Python versions and optional packages."""
+
+import sys
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+# Slotted dataclasses (no per-instance __dict__) are available from Python 3.10
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine, on the faster libuv based event loop when installed."""
+    # Imported here, so that loading the CLI (e.g. for --help) doesn't pay
+    # for asyncio
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    # uvloop.run (uvloop 0.18+) replaces the deprecated uvloop.install(), and
+    # creates its loop through asyncio.Runner's loop_factory on Python 3.12+
+    if hasattr(uvloop, "run"):
+        return uvloop.run(main)
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
@@ -0,0 +1,36 @@
+"""Lazy loading of package attributes (PEP 562)."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create a package's __getattr__ and __dir__ for names imported on use.
+
+    Args:
+        package: Name of the package
+        exports: Module each public name is imported from, relative to the
+            package
+
+    Returns:
+        The package's __getattr__ and __dir__ functions
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups bypass __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,6 +1,15 @@
 """API client package for Mastodon integration."""
 
-from .client import MastodonClient
-from .models import Account, Notification, Status
+from tootles._lazy import lazy_exports
+
+_LAZY = {
+    "MastodonClient": ".client",
+    "Status": ".models",
+    "Account": ".models",
+    "Notification": ".models",
+}
 
 __all__ = ["MastodonClient", "Status", "Account", "Notification"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -1,12 +1,58 @@
 """Mastodon API client implementation."""
 
-import json
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import asyncio
+import random
+import re
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 import httpx
+import orjson
 
-from .models import Account, Notification, Status
+from .models import Account, Notification, Status, _parse_ts
+
+# Connection pool sizing shared by all requests made through one client
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+# Retry policy for rate limited (429) and temporarily unavailable responses
+MAX_RETRIES = 3
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Methods that are safe to repeat after one of RETRY_STATUS_CODES. A proxy may
+# return those after the server already handled the request, so other methods
+# are only retried when sent with an Idempotency-Key.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RATE_LIMIT_MAX_WAIT = 30.0  # seconds; longer waits are reported as errors
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One entry of a pagination Link header, e.g. <https://...>; rel="next"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+
+T = TypeVar("T")
+
+
+def _compact(**values: Any) -> Dict[str, Any]:
+    """Return the given values, leaving out those that are unset or empty."""
+    return {key: value for key, value in values.items() if value}
+
+
+def _parse_links(header: str) -> Dict[str, str]:
+    """Parse a Link header into a mapping of rel (e.g. "next") to URL."""
+    return {rel: url for url, rel in _LINK_RE.findall(header)}
+
+
+class Page(List[T]):
+    """One page of items from a list endpoint."""
+
+    def __init__(self, items: Iterable[T], links: Dict[str, str]):
+        super().__init__(items)
+        # Pagination URLs ("next", "prev") from the response's Link header
+        self.links = links
 
 
 class MastodonAPIError(Exception):
@@ -20,6 +66,13 @@ class MastodonAPIError(Exception):
 class MastodonClient:
     """Async Mastodon API client."""
 
+    # HTTP clients shared by all MastodonClient instances, keyed by instance
+    # URL and event loop, so that e.g. several accounts on one server share a
+    # connection pool, but connections never outlive the loop they belong to.
+    # Credentials are sent per request, never stored on the shared client.
+    _shared_clients: Dict[Tuple[str, asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+    _client_users: Dict[Tuple[str, asyncio.AbstractEventLoop], int] = {}
+
     def __init__(self, instance_url: str, access_token: Optional[str] = None):
         """Initialize the Mastodon client.
 
@@ -29,7 +82,19 @@ class MastodonClient:
         """
         self.instance_url = instance_url.rstrip("/")
         self.access_token = access_token
+        self._api_base = f"{self.instance_url}/api/v1/"
         self._client: Optional[httpx.AsyncClient] = None
+        # Key of the shared client in use, None when not using a shared one
+        self._client_key: Optional[Tuple[str, asyncio.AbstractEventLoop]] = None
+
+        self._headers = {}
+        if access_token:
+            self._headers["Authorization"] = f"Bearer {access_token}"
+        self._json_headers = {**self._headers, **JSON_HEADERS}
+
+        # Rate limit state from the most recent response's X-RateLimit-* headers
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[datetime] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -38,22 +103,88 @@ class MastodonClient:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self.close()
 
-    async def _ensure_client(self):
-        """Ensure HTTP client is initialized."""
-        if not self._client:
-            headers = {"User-Agent": "Tootles/1.0.0"}
-            if self.access_token:
-                headers["Authorization"] = f"Bearer {self.access_token}"
-
-            self._client = httpx.AsyncClient(
-                headers=headers,
+    async def close(self) -> None:
+        """Stop using the shared HTTP client.
+
+        The pooled connections stay open while other clients of the same
+        instance use them, and are closed with the last one. Safe to call
+        more than once; a later request attaches to a shared client again.
+        """
+        key = self._client_key
+        client = self._client
+        self._client = None
+        self._client_key = None
+        # A client closed by close_all() was already released
+        if key is not None and client is not None and not client.is_closed:
+            await self._release_client(key)
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """Close every shared HTTP client and its pooled connections."""
+        loop = asyncio.get_running_loop()
+        clients = list(cls._shared_clients.items())
+        cls._shared_clients.clear()
+        cls._client_users.clear()
+        for (_, client_loop), client in clients:
+            # Clients of another loop can't be closed from this one
+            if client_loop is loop:
+                await client.aclose()
+
+    @classmethod
+    def _acquire_client(
+        cls, key: Tuple[str, asyncio.AbstractEventLoop]
+    ) -> httpx.AsyncClient:
+        """Get the shared HTTP client for key, creating it if needed."""
+        # Forget clients of loops that have since been closed
+        for stale_key in [k for k in cls._shared_clients if k[1].is_closed()]:
+            del cls._shared_clients[stale_key]
+            cls._client_users.pop(stale_key, None)
+
+        client = cls._shared_clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers={"User-Agent": "Tootles/1.0.0"},
                 timeout=30.0,
-                follow_redirects=True
+                follow_redirects=True,
+                http2=True,
+                limits=POOL_LIMITS,
             )
+            cls._shared_clients[key] = client
+        cls._client_users[key] = cls._client_users.get(key, 0) + 1
+        return client
+
+    @classmethod
+    async def _release_client(cls, key: Tuple[str, asyncio.AbstractEventLoop]) -> None:
+        """Stop using the shared HTTP client, closing it if it was the last user."""
+        users = cls._client_users.get(key, 0) - 1
+        if users > 0:
+            cls._client_users[key] = users
+            return
+
+        cls._client_users.pop(key, None)
+        client = cls._shared_clients.pop(key, None)
+        if client and key[1] is asyncio.get_running_loop():
+            await client.aclose()
+
+    async def _ensure_client(self):
+        """Ensure HTTP client is initialized.
+
+        All clients for the same instance share one HTTP client per event
+        loop, created on first use, so every API call reuses the same pool of
+        keep-alive connections. A client whose HTTP client was closed, e.g.
+        by close_all(), or belongs to another loop picks up a new one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and not self._client.is_closed:
+            if self._client_key is None or self._client_key[1] is loop:
+                return
+
+        await self.close()
+        key = (self.instance_url, loop)
+        self._client = self._acquire_client(key)
+        self._client_key = key
 
     async def _request(
         self,
@@ -61,6 +192,7 @@ class MastodonClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Make an authenticated request to the Mastodon API.
 
@@ -69,39 +201,154 @@ class MastodonClient:
             endpoint: API endpoint (without leading slash)
             params: Query parameters
             json_data: JSON request body
+            idempotency_key: Idempotency-Key header value, which lets the
+                server recognize a retried non-idempotent request
 
         Returns:
             Parsed JSON response
 
+        Raises:
+            MastodonAPIError: If the request fails
+        """
+        response = await self._send(method, endpoint, params, json_data, idempotency_key)
+        return orjson.loads(response.content)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> httpx.Response:
+        """Send a request, retrying as needed, and return the response.
+
+        Takes the same arguments as _request.
+
         Raises:
             MastodonAPIError: If the request fails
         """
         await self._ensure_client()
 
-        url = urljoin(f"{self.instance_url}/api/v1/", endpoint)
+        url = self._api_base + endpoint
+
+        # Encode the body once, it is reused if the request is retried
+        content = None
+        headers = self._headers
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            headers = self._json_headers
+        if idempotency_key:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+        retry_server_errors = (
+            method in IDEMPOTENT_METHODS or idempotency_key is not None
+        )
 
         try:
-            response = await self._client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data
-            )
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                )
+                self._update_rate_limit(response)
+
+                delay = self._retry_delay(response, attempt, retry_server_errors)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
 
             if response.status_code >= 400:
+                body = response.content
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(body)
                     error_msg = error_data.get("error", f"HTTP {response.status_code}")
-                except (json.JSONDecodeError, KeyError):
-                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                except (orjson.JSONDecodeError, AttributeError):
+                    text = body.decode("utf-8", "replace")
+                    error_msg = f"HTTP {response.status_code}: {text}"
 
                 raise MastodonAPIError(error_msg, response.status_code)
 
-            return response.json()
+            return response
 
         except httpx.RequestError as e:
             raise MastodonAPIError(f"Request failed: {e}") from e
 
+    async def _request_list(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        from_list: Callable[[List[Dict[str, Any]]], List[T]],
+    ) -> Page[T]:
+        """Fetch a JSON array from a list endpoint and decode its items.
+
+        The body is decoded in one pass with orjson once it has arrived;
+        Mastodon pages are small (at most 40 items), so incremental parsing
+        while the body streams in would not hide any meaningful latency.
+
+        The page carries the pagination links of the response, so
+        concurrent requests each get their own.
+
+        Args:
+            endpoint: API endpoint (without leading slash)
+            params: Query parameters
+            from_list: Constructor for the list of items
+
+        Returns:
+            Page of decoded items
+        """
+        response = await self._send("GET", endpoint, params=params)
+        links = _parse_links(response.headers.get("Link", ""))
+        return Page(from_list(orjson.loads(response.content)), links)
+
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        """Record rate limit state from the response headers, if present."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                self.rate_limit_remaining = int(remaining)
+            except ValueError:
+                pass
+
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset is not None:
+            try:
+                self.rate_limit_reset = _parse_ts(reset)
+            except ValueError:
+                pass
+
+    def _retry_delay(
+        self,
+        response: httpx.Response,
+        attempt: int,
+        retry_server_errors: bool,
+    ) -> Optional[float]:
+        """Return how long to wait before retrying, or None to not retry.
+
+        Rate limited requests were not handled by the server and are always
+        retried; server errors only when retry_server_errors is set.
+        """
+        if attempt >= MAX_RETRIES:
+            return None
+
+        if response.status_code == 429:
+            # Wait for the rate limit window to reset, unless that is too far off
+            if self.rate_limit_reset is None:
+                return 1.0
+
+            wait = (self.rate_limit_reset - datetime.now(timezone.utc)).total_seconds()
+            if wait > RATE_LIMIT_MAX_WAIT:
+                return None
+            return max(wait, 0.5)
+
+        if retry_server_errors and response.status_code in RETRY_STATUS_CODES:
+            # Exponential backoff with jitter
+            return (2 ** attempt) * 0.25 + random.random() * 0.1
+
+        return None
+
     async def verify_credentials(self) -> Account:
         """Verify account credentials and return account info.
 
@@ -117,7 +364,7 @@ class MastodonClient:
         since_id: Optional[str] = None,
         min_id: Optional[str] = None,
         limit: int = 20
-    ) -> List[Status]:
+    ) -> Page[Status]:
         """Get the home timeline.
 
         Args:
@@ -127,19 +374,14 @@ class MastodonClient:
             limit: Maximum number of results (1-40, default 20)
 
         Returns:
-            List of Status objects
+            Page of Status objects, with its pagination links
         """
-        params = {"limit": min(max(limit, 1), 40)}
-
-        if max_id:
-            params["max_id"] = max_id
-        if since_id:
-            params["since_id"] = since_id
-        if min_id:
-            params["min_id"] = min_id
+        params = {
+            "limit": max(1, min(limit, 40)),
+            **_compact(max_id=max_id, since_id=since_id, min_id=min_id),
+        }
 
-        data = await self._request("GET", "timelines/home", params=params)
-        return [Status.from_dict(status) for status in data]
+        return await self._request_list("timelines/home", params, Status.from_list)
 
     async def get_public_timeline(
         self,
@@ -150,7 +392,7 @@ class MastodonClient:
         since_id: Optional[str] = None,
         min_id: Optional[str] = None,
         limit: int = 20
-    ) -> List[Status]:
+    ) -> Page[Status]:
         """Get the public timeline.
 
         Args:
@@ -163,25 +405,21 @@ class MastodonClient:
             limit: Maximum number of results (1-40, default 20)
 
         Returns:
-            List of Status objects
+            Page of Status objects, with its pagination links
         """
-        params = {"limit": min(max(limit, 1), 40)}
-
-        if local:
-            params["local"] = "true"
-        if remote:
-            params["remote"] = "true"
-        if only_media:
-            params["only_media"] = "true"
-        if max_id:
-            params["max_id"] = max_id
-        if since_id:
-            params["since_id"] = since_id
-        if min_id:
-            params["min_id"] = min_id
-
-        data = await self._request("GET", "timelines/public", params=params)
-        return [Status.from_dict(status) for status in data]
+        params = {
+            "limit": max(1, min(limit, 40)),
+            **_compact(
+                local=local and "true",
+                remote=remote and "true",
+                only_media=only_media and "true",
+                max_id=max_id,
+                since_id=since_id,
+                min_id=min_id,
+            ),
+        }
+
+        return await self._request_list("timelines/public", params, Status.from_list)
 
     async def get_notifications(
         self,
@@ -190,7 +428,7 @@ class MastodonClient:
         min_id: Optional[str] = None,
         limit: int = 15,
         exclude_types: Optional[List[str]] = None
-    ) -> List[Notification]:
+    ) -> Page[Notification]:
         """Get notifications.
 
         Args:
@@ -201,22 +439,18 @@ class MastodonClient:
             exclude_types: Array of notification types to exclude
 
         Returns:
-            List of Notification objects
+            Page of Notification objects, with its pagination links
         """
-        params = {"limit": min(max(limit, 1), 30)}
-
-        if max_id:
-            params["max_id"] = max_id
-        if since_id:
-            params["since_id"] = since_id
-        if min_id:
-            params["min_id"] = min_id
+        params = {
+            "limit": max(1, min(limit, 30)),
+            **_compact(max_id=max_id, since_id=since_id, min_id=min_id),
+        }
+
+        # httpx sends list values as repeated query parameters
         if exclude_types:
-            for exclude_type in exclude_types:
-                params["exclude_types[]"] = exclude_type
+            params["exclude_types[]"] = list(exclude_types)
 
-        data = await self._request("GET", "notifications", params=params)
-        return [Notification.from_dict(notification) for notification in data]
+        return await self._request_list("notifications", params, Notification.from_list)
 
     async def post_status(
         self,
@@ -245,19 +479,20 @@ class MastodonClient:
         json_data = {
             "status": status,
             "visibility": visibility,
-            "sensitive": sensitive
+            "sensitive": sensitive,
+            **_compact(
+                in_reply_to_id=in_reply_to_id,
+                media_ids=media_ids,
+                spoiler_text=spoiler_text,
+                language=language,
+            ),
         }
 
-        if in_reply_to_id:
-            json_data["in_reply_to_id"] = in_reply_to_id
-        if media_ids:
-            json_data["media_ids"] = media_ids
-        if spoiler_text:
-            json_data["spoiler_text"] = spoiler_text
-        if language:
-            json_data["language"] = language
-
-        data = await self._request("POST", "statuses", json_data=json_data)
+        # Posting is not idempotent, the key keeps a retry from publishing
+        # the status twice
+        data = await self._request(
+            "POST", "statuses", json_data=json_data, idempotency_key=uuid.uuid4().hex
+        )
         return Status.from_dict(data)
 
     async def favourite_status(self, status_id: str) -> Status:
@@ -331,3 +566,68 @@ class MastodonClient:
         """
         data = await self._request("POST", f"statuses/{status_id}/unbookmark")
         return Status.from_dict(data)
+
+    async def _for_each(
+        self,
+        action: Callable[[str], Awaitable[Status]],
+        status_ids: Iterable[str],
+    ) -> List[Status]:
+        """Run a per-status action concurrently for several statuses.
+
+        Concurrency is bounded by the number of keep-alive connections in the
+        pool, so requests reuse open connections instead of opening new ones.
+
+        Returns:
+            The resulting Status objects, in the order of status_ids
+        """
+        semaphore = asyncio.Semaphore(POOL_LIMITS.max_keepalive_connections)
+
+        async def run(status_id: str) -> Status:
+            async with semaphore:
+                return await action(status_id)
+
+        return list(await asyncio.gather(*(run(status_id) for status_id in status_ids)))
+
+    async def favourite_many(self, status_ids: Iterable[str]) -> List[Status]:
+        """Favourite several statuses concurrently.
+
+        Args:
+            status_ids: IDs of the statuses to favourite
+
+        Returns:
+            The favourited Status objects
+        """
+        return await self._for_each(self.favourite_status, status_ids)
+
+    async def unfavourite_many(self, status_ids: Iterable[str]) -> List[Status]:
+        """Unfavourite several statuses concurrently.
+
+        Args:
+            status_ids: IDs of the statuses to unfavourite
+
+        Returns:
+            The unfavourited Status objects
+        """
+        return await self._for_each(self.unfavourite_status, status_ids)
+
+    async def reblog_many(self, status_ids: Iterable[str]) -> List[Status]:
+        """Reblog several statuses concurrently.
+
+        Args:
+            status_ids: IDs of the statuses to reblog
+
+        Returns:
+            The reblogged Status objects
+        """
+        return await self._for_each(self.reblog_status, status_ids)
+
+    async def unreblog_many(self, status_ids: Iterable[str]) -> List[Status]:
+        """Unreblog several statuses concurrently.
+
+        Args:
+            status_ids: IDs of the statuses to unreblog
+
+        Returns:
+            The unreblogged Status objects
+        """
+        return await self._for_each(self.unreblog_status, status_ids)
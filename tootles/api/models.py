@@ -4,8 +4,17 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from tootles._compat import DATACLASS_OPTIONS
 
-@dataclass
+
+def _parse_ts(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp as returned by the Mastodon API."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Account:
     """Represents a Mastodon account."""
 
@@ -34,6 +43,7 @@ class Account:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Account":
         """Create Account from API response data."""
+        last_status_at = data.get("last_status_at")
         return cls(
             id=data["id"],
             username=data["username"],
@@ -43,9 +53,7 @@ class Account:
             bot=data["bot"],
             discoverable=data.get("discoverable"),
             group=data["group"],
-            created_at=datetime.fromisoformat(
-                data["created_at"].replace("Z", "+00:00")
-            ),
+            created_at=_parse_ts(data["created_at"]),
             note=data["note"],
             url=data["url"],
             avatar=data["avatar"],
@@ -55,15 +63,21 @@ class Account:
             followers_count=data["followers_count"],
             following_count=data["following_count"],
             statuses_count=data["statuses_count"],
-            last_status_at=datetime.fromisoformat(
-                data["last_status_at"].replace("Z", "+00:00")
-            ) if data.get("last_status_at") else None,
+            last_status_at=_parse_ts(last_status_at) if last_status_at else None,
             emojis=data["emojis"],
             fields=data["fields"],
         )
 
 
-@dataclass
+def _get_account(data: Dict[str, Any], accounts: Dict[str, Account]) -> Account:
+    """Decode an account, reusing one already decoded from the same response."""
+    account = accounts.get(data["id"])
+    if account is None:
+        account = accounts[data["id"]] = Account.from_dict(data)
+    return account
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class MediaAttachment:
     """Represents a media attachment."""
 
@@ -93,7 +107,7 @@ class MediaAttachment:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Status:
     """Represents a Mastodon status (toot)."""
 
@@ -128,22 +142,34 @@ class Status:
     pinned: bool
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Status":
-        """Create Status from API response data."""
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        accounts: Optional[Dict[str, Account]] = None,
+    ) -> "Status":
+        """Create Status from API response data.
+
+        Accounts are decoded once per `accounts` mapping; pass the same mapping
+        when decoding several statuses from one response (see `from_list`).
+        """
+        if accounts is None:
+            accounts = {}
+
+        # Mastodon does not nest reblogs, so this recurses at most once
+        reblog = data.get("reblog")
+
         return cls(
             id=data["id"],
             uri=data["uri"],
-            created_at=datetime.fromisoformat(
-                data["created_at"].replace("Z", "+00:00")
-            ),
-            account=Account.from_dict(data["account"]),
+            created_at=_parse_ts(data["created_at"]),
+            account=_get_account(data["account"], accounts),
             content=data["content"],
             visibility=data["visibility"],
             sensitive=data["sensitive"],
             spoiler_text=data["spoiler_text"],
-            media_attachments=[
-                MediaAttachment.from_dict(m) for m in data["media_attachments"]
-            ],
+            media_attachments=list(
+                map(MediaAttachment.from_dict, data["media_attachments"])
+            ),
             application=data.get("application"),
             mentions=data["mentions"],
             tags=data["tags"],
@@ -154,7 +180,7 @@ class Status:
             url=data.get("url"),
             in_reply_to_id=data.get("in_reply_to_id"),
             in_reply_to_account_id=data.get("in_reply_to_account_id"),
-            reblog=cls.from_dict(data["reblog"]) if data.get("reblog") else None,
+            reblog=cls.from_dict(reblog, accounts) if reblog else None,
             poll=data.get("poll"),
             card=data.get("card"),
             language=data.get("language"),
@@ -166,8 +192,14 @@ class Status:
             pinned=data.get("pinned", False),
         )
 
+    @classmethod
+    def from_list(cls, items: List[Dict[str, Any]]) -> List["Status"]:
+        """Create Statuses from a list response, sharing repeated accounts."""
+        accounts: Dict[str, Account] = {}
+        return [cls.from_dict(item, accounts) for item in items]
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Notification:
     """Represents a Mastodon notification."""
 
@@ -178,14 +210,27 @@ class Notification:
     status: Optional[Status]
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Notification":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        accounts: Optional[Dict[str, Account]] = None,
+    ) -> "Notification":
         """Create Notification from API response data."""
+        if accounts is None:
+            accounts = {}
+
+        status = data.get("status")
+
         return cls(
             id=data["id"],
             type=data["type"],
-            created_at=datetime.fromisoformat(
-                data["created_at"].replace("Z", "+00:00")
-            ),
-            account=Account.from_dict(data["account"]),
-            status=Status.from_dict(data["status"]) if data.get("status") else None,
+            created_at=_parse_ts(data["created_at"]),
+            account=_get_account(data["account"], accounts),
+            status=Status.from_dict(status, accounts) if status else None,
         )
+
+    @classmethod
+    def from_list(cls, items: List[Dict[str, Any]]) -> List["Notification"]:
+        """Create Notifications from a list response, sharing repeated accounts."""
+        accounts: Dict[str, Account] = {}
+        return [cls.from_dict(item, accounts) for item in items]
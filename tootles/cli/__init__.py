@@ -1 +1,34 @@
 """CLI module for Tootles."""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+def main() -> None:
+    """Console script entry point.
+
+    A bare `tootles` invocation starts the app directly, skipping the import
+    of click and the command group; anything else is handed to the CLI.
+    """
+    if len(sys.argv) > 1:
+        from tootles.cli.main import cli
+
+        cli()
+        return
+
+    run_app(None)
+
+
+def run_app(config: Optional[Path]) -> None:
+    """Run the app, reporting errors and exiting with status 1 on failure."""
+    from tootles.main import main as run_main
+
+    try:
+        run_main(config)
+    except KeyboardInterrupt:
+        print("Interrupted by user", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -1,13 +1,12 @@
 """CLI entry point for Tootles."""
 
-import sys
 from pathlib import Path
 from typing import Optional
 
 import click
 
+from tootles.cli import run_app
 from tootles.cli.setup import setup
-from tootles.main import main as run_app
 
 
 # Override the group to make 'run' the default command
@@ -24,14 +23,7 @@ def cli(ctx: click.Context, config: Optional[Path]):
     """Tootles - Modern Textual-based Mastodon client."""
     if ctx.invoked_subcommand is None:
         # No subcommand provided, run the main app
-        try:
-            run_app(config)
-        except KeyboardInterrupt:
-            click.echo("Interrupted by user", err=True)
-            sys.exit(1)
-        except Exception as e:
-            click.echo(f"Error: {e}", err=True)
-            sys.exit(1)
+        ctx.invoke(run, config=config)
 
 
 @cli.command()
@@ -43,14 +35,7 @@ def cli(ctx: click.Context, config: Optional[Path]):
 )
 def run(config: Optional[Path]) -> None:
     """Run the Tootles application."""
-    try:
-        run_app(config)
-    except KeyboardInterrupt:
-        click.echo("Interrupted by user", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    run_app(config)
 
 
 # Add the setup command
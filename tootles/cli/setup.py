@@ -1,25 +1,45 @@
 """Setup command for Tootles configuration."""
 
-import webbrowser
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import quote_plus
 
 import click
-import httpx
 
-from tootles.config.manager import ConfigManager
+from tootles._compat import DATACLASS_OPTIONS, run
 
+# httpx, webbrowser and the config manager are imported where they are used,
+# so that loading the CLI (e.g. for --help) doesn't pay for them
+if TYPE_CHECKING:
+    import httpx
 
+# Query string of the OAuth authorization URL, up to the app's client id
+AUTHORIZE_QUERY_PREFIX = (
+    "response_type=code"
+    "&redirect_uri=urn%3Aietf%3Awg%3Aoauth%3A2.0%3Aoob"
+    "&scope=read+write+follow"
+    "&client_id="
+)
+
+URL_SCHEMES = ("http://", "https://")
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class MastodonApp:
     """Represents a Mastodon application registration."""
 
-    def __init__(self, instance: str, base_url: str, client_id: str, client_secret: str):
-        self.instance = instance
-        self.base_url = base_url
-        self.client_id = client_id
-        self.client_secret = client_secret
+    instance: str
+    base_url: str
+    client_id: str
+    client_secret: str
 
 
-async def create_app(base_url: str) -> MastodonApp:
+async def create_app(client: "httpx.AsyncClient", base_url: str) -> MastodonApp:
     """Register a new application with the Mastodon instance."""
+    import httpx
+    import orjson
+
     url = f"{base_url}/api/v1/apps"
 
     data = {
@@ -29,41 +49,37 @@ async def create_app(base_url: str) -> MastodonApp:
         'website': 'https://github.com/tootles/tootles',
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(url, json=data)
-            response.raise_for_status()
-            app_data = response.json()
+    try:
+        response = await client.post(url, json=data)
+        response.raise_for_status()
+        app_data = orjson.loads(response.content)
 
-            # Extract domain from base_url for instance name
-            instance = base_url.replace('https://', '').replace('http://', '').rstrip('/')
+        # Extract domain from base_url for instance name
+        instance = base_url.replace('https://', '').replace('http://', '').rstrip('/')
 
-            return MastodonApp(
-                instance=instance,
-                base_url=base_url,
-                client_id=app_data['client_id'],
-                client_secret=app_data['client_secret']
-            )
-        except httpx.HTTPError as e:
-            raise click.ClickException(f"Failed to register app with {base_url}: {e}") from e
+        return MastodonApp(
+            instance=instance,
+            base_url=base_url,
+            client_id=app_data['client_id'],
+            client_secret=app_data['client_secret']
+        )
+    except httpx.HTTPError as e:
+        raise click.ClickException(f"Failed to register app with {base_url}: {e}") from e
 
 
 def get_browser_login_url(app: MastodonApp) -> str:
     """Generate the OAuth authorization URL."""
-    from urllib.parse import urlencode
-
-    params = {
-        "response_type": "code",
-        "redirect_uri": "urn:ietf:wg:oauth:2.0:oob",
-        "scope": "read write follow",
-        "client_id": app.client_id,
-    }
+    client_id = quote_plus(app.client_id, safe="")
+    return f"{app.base_url}/oauth/authorize/?{AUTHORIZE_QUERY_PREFIX}{client_id}"
 
-    return f"{app.base_url}/oauth/authorize/?{urlencode(params)}"
 
-
-async def request_access_token(app: MastodonApp, authorization_code: str) -> str:
+async def request_access_token(
+    client: "httpx.AsyncClient", app: MastodonApp, authorization_code: str
+) -> str:
     """Exchange authorization code for access token."""
+    import httpx
+    import orjson
+
     url = f"{app.base_url}/oauth/token"
 
     data = {
@@ -74,14 +90,13 @@ async def request_access_token(app: MastodonApp, authorization_code: str) -> str
         'redirect_uri': 'urn:ietf:wg:oauth:2.0:oob',
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(url, data=data, follow_redirects=False)
-            response.raise_for_status()
-            token_data = response.json()
-            return token_data['access_token']
-        except httpx.HTTPError as e:
-            raise click.ClickException(f"Failed to get access token: {e}") from e
+    try:
+        response = await client.post(url, data=data, follow_redirects=False)
+        response.raise_for_status()
+        token_data = orjson.loads(response.content)
+        return token_data['access_token']
+    except httpx.HTTPError as e:
+        raise click.ClickException(f"Failed to get access token: {e}") from e
 
 
 def validate_instance_url(ctx, param, value: str) -> str:
@@ -90,7 +105,7 @@ def validate_instance_url(ctx, param, value: str) -> str:
         return value
 
     # Add https:// if no protocol specified
-    if not value.startswith(('http://', 'https://')):
+    if not value.startswith(URL_SCHEMES):
         value = f"https://{value}"
 
     # Remove trailing slash
@@ -109,14 +124,28 @@ def validate_instance_url(ctx, param, value: str) -> str:
 )
 def setup(instance: str):
     """Set up Tootles with your Mastodon account using browser authentication."""
-    import asyncio
+    import webbrowser
+
+    import httpx
+
+    from tootles.config.manager import ConfigManager
 
     async def setup_flow():
+        # Registration and token exchange hit the same host, so keep the
+        # connection opened by the former around for the latter
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        ) as client:
+            await authorize(client)
+
+    async def authorize(client: httpx.AsyncClient):
         click.echo(f"Setting up Tootles for {instance}...")
 
         # Register app with the instance
         try:
-            app = await create_app(instance)
+            app = await create_app(client, instance)
             click.echo(f"✓ Registered Tootles with {instance}")
         except Exception as e:
             raise click.ClickException(f"Failed to register with instance: {e}") from e
@@ -136,14 +165,10 @@ def setup(instance: str):
         click.echo("\nAuthorization URL:")
         click.echo(auth_url)
 
-        # Ask to open browser
-        open_browser = click.prompt(
-            "\nOpen this URL in your browser? [Y/n]",
-            default="Y",
-            show_default=False
-        )
-
-        if not open_browser or open_browser.lower() == 'y':
+        # Ask to open browser, unless there is no terminal to answer from
+        if not sys.stdin.isatty() or click.confirm(
+            "\nOpen this URL in your browser?", default=True
+        ):
             try:
                 webbrowser.open(auth_url)
                 click.echo("✓ Opened authorization page in your browser")
@@ -159,7 +184,7 @@ def setup(instance: str):
 
         # Exchange code for token
         try:
-            access_token = await request_access_token(app, authorization_code)
+            access_token = await request_access_token(client, app, authorization_code)
             click.echo("✓ Successfully obtained access token")
         except Exception as e:
             raise click.ClickException(f"Failed to get access token: {e}") from e
@@ -174,7 +199,7 @@ def setup(instance: str):
         click.echo("\n🎉 Setup complete! You can now run 'tootles' to start the application.")
 
     # Run the async setup flow
-    asyncio.run(setup_flow())
+    run(setup_flow())
 
 
 if __name__ == "__main__":
@@ -1,44 +1,68 @@
 """Configuration manager for Tootles."""
 
+from dataclasses import fields
 from pathlib import Path
 from typing import Optional
 
-import tomlkit
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
 
 from tootles.config.schema import TootlesConfig
 
+# Comments written above the settings, which follow in this order
+CONFIG_HEADER = """\
+# Tootles Configuration
+#
+# Instance settings: instance_url, access_token
+# UI settings: theme, auto_refresh, refresh_interval, show_media_previews
+# Timeline settings: timeline_limit, enable_streaming, mark_notifications_read
+# Search settings: search_history_size, enable_fuzzy_search
+# Theme settings: theme_directory, enable_theme_hot_reload
+# Advanced settings: cache_size, rate_limit_requests, rate_limit_window
+# Custom timelines: timelines
+
+"""
+
 
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
 
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or self._get_default_config_path()
+        # Last TOML text written by _save_config, used to skip no-op writes
+        self._saved_text: Optional[str] = None
+        # Modification time of the file as of the last load or save, used to
+        # skip re-parsing it on reload when it has not changed
+        self._mtime_ns: Optional[int] = None
         self.config = self._load_config()
 
     def _get_default_config_path(self) -> Path:
         """Get the default configuration file path."""
-        config_dir = Path.home() / ".config" / "tootles"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "config.toml"
+        return Path.home() / ".config" / "tootles" / "config.toml"
 
     def _load_config(self) -> TootlesConfig:
-        """Load configuration from file or create default."""
+        """Load configuration from file or create default.
+
+        The default configuration is only written to disk once saved.
+        """
         if not self.config_path.exists():
-            config = TootlesConfig()
-            self._save_config(config)
-            return config
+            return TootlesConfig()
 
         try:
-            with open(self.config_path, encoding="utf-8") as f:
-                data = tomlkit.load(f)
+            mtime_ns = self.config_path.stat().st_mtime_ns
+            data = tomllib.loads(self.config_path.read_text(encoding="utf-8"))
 
             # Convert TOML data to config object
             config = TootlesConfig()
+            config_fields = TootlesConfig.__dataclass_fields__
             for key, value in data.items():
-                if hasattr(config, key):
+                if key in config_fields:
                     setattr(config, key, value)
 
             config.validate()
+            self._mtime_ns = mtime_ns
             return config
         except Exception:
             # If config is invalid, create a backup and use defaults
@@ -46,64 +70,34 @@ class ConfigManager:
             if self.config_path.exists():
                 self.config_path.rename(backup_path)
 
-            config = TootlesConfig()
-            self._save_config(config)
-            return config
+            return TootlesConfig()
 
     def _save_config(self, config: TootlesConfig) -> None:
         """Save configuration to file."""
-        # Convert config object to dict
-        config_dict = {}
-        for field_name in config.__dataclass_fields__:
-            value = getattr(config, field_name)
-            config_dict[field_name] = value
-
-        # Create TOML document
-        doc = tomlkit.document()
-        doc.add(tomlkit.comment("Tootles Configuration"))
-        doc.add(tomlkit.nl())
-
-        # Add sections with comments
-        doc.add(tomlkit.comment("Instance settings"))
-        doc["instance_url"] = config_dict["instance_url"]
-        doc["access_token"] = config_dict["access_token"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("UI settings"))
-        doc["theme"] = config_dict["theme"]
-        doc["auto_refresh"] = config_dict["auto_refresh"]
-        doc["refresh_interval"] = config_dict["refresh_interval"]
-        doc["show_media_previews"] = config_dict["show_media_previews"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("Timeline settings"))
-        doc["timeline_limit"] = config_dict["timeline_limit"]
-        doc["enable_streaming"] = config_dict["enable_streaming"]
-        doc["mark_notifications_read"] = config_dict["mark_notifications_read"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("Search settings"))
-        doc["search_history_size"] = config_dict["search_history_size"]
-        doc["enable_fuzzy_search"] = config_dict["enable_fuzzy_search"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("Theme settings"))
-        doc["theme_directory"] = config_dict["theme_directory"]
-        doc["enable_theme_hot_reload"] = config_dict["enable_theme_hot_reload"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("Advanced settings"))
-        doc["cache_size"] = config_dict["cache_size"]
-        doc["rate_limit_requests"] = config_dict["rate_limit_requests"]
-        doc["rate_limit_window"] = config_dict["rate_limit_window"]
-        doc.add(tomlkit.nl())
-
-        doc.add(tomlkit.comment("Custom timelines"))
-        doc["timelines"] = config_dict["timelines"]
-
-        # Write to file
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            tomlkit.dump(doc, f)
+        # Only writing needs tomlkit, reading uses tomllib
+        import tomlkit
+
+        # Convert config object to dict. Media settings are not persisted,
+        # _load_config would read them back as a plain table. tomlkit only
+        # reads the values, so there is no need for asdict's deep copy.
+        config_dict = {
+            f.name: getattr(config, f.name) for f in fields(config) if f.name != "media"
+        }
+
+        # Write to file, unless it still holds exactly this content: the same
+        # text was saved last and the file hasn't been modified since
+        text = CONFIG_HEADER + tomlkit.dumps(config_dict)
+        if text == self._saved_text:
+            try:
+                if self.config_path.stat().st_mtime_ns == self._mtime_ns:
+                    return
+            except OSError:
+                pass
+
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        self.config_path.write_text(text, encoding="utf-8")
+        self._saved_text = text
+        self._mtime_ns = self.config_path.stat().st_mtime_ns
 
     def save(self) -> None:
         """Save current configuration to file."""
@@ -111,8 +105,14 @@ class ConfigManager:
         self._save_config(self.config)
 
     def reload(self) -> None:
-        """Reload configuration from file."""
-        self.config = self._load_config()
+        """Reload configuration from file, if it changed since last loaded or saved."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        if mtime_ns is None or mtime_ns != self._mtime_ns:
+            self.config = self._load_config()
 
     def get_config_dir(self) -> Path:
         """Get the configuration directory."""
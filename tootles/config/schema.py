@@ -2,10 +2,22 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from tootles._compat import DATACLASS_OPTIONS
 
-@dataclass
+# Allowed ranges checked by TootlesConfig.validate: (field, min, max, message)
+_BOUNDS: Tuple[Tuple[str, int, Optional[int], str], ...] = (
+    ("timeline_limit", 1, 100, "timeline_limit must be between 1 and 100"),
+    ("refresh_interval", 10, None, "refresh_interval must be at least 10 seconds"),
+    ("search_history_size", 0, None, "search_history_size must be non-negative"),
+    ("cache_size", 0, None, "cache_size must be non-negative"),
+    ("rate_limit_requests", 1, None, "rate_limit_requests must be positive"),
+    ("rate_limit_window", 1, None, "rate_limit_window must be positive"),
+)
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class MediaConfig:
     """Media-specific configuration."""
 
@@ -39,7 +51,7 @@ class MediaConfig:
     ])
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class TootlesConfig:
     """Main configuration structure for Tootles."""
 
@@ -83,20 +95,7 @@ class TootlesConfig:
 
     def validate(self) -> None:
         """Validate configuration values."""
-        if self.timeline_limit < 1 or self.timeline_limit > 100:
-            raise ValueError("timeline_limit must be between 1 and 100")
-
-        if self.refresh_interval < 10:
-            raise ValueError("refresh_interval must be at least 10 seconds")
-
-        if self.search_history_size < 0:
-            raise ValueError("search_history_size must be non-negative")
-
-        if self.cache_size < 0:
-            raise ValueError("cache_size must be non-negative")
-
-        if self.rate_limit_requests < 1:
-            raise ValueError("rate_limit_requests must be positive")
-
-        if self.rate_limit_window < 1:
-            raise ValueError("rate_limit_window must be positive")
+        for name, low, high, message in _BOUNDS:
+            value = getattr(self, name)
+            if value < low or (high is not None and value > high):
+                raise ValueError(message)
@@ -1,7 +1,8 @@
 """Main Tootles application."""
 
 import logging
-from typing import List, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -9,6 +10,7 @@ from textual.containers import Horizontal, Vertical
 from textual.css.query import NoMatches
 from textual.widgets import Footer, Header, Static
 
+from tootles._compat import run
 from tootles.api.client import MastodonClient
 from tootles.api.models import Status
 from tootles.config.manager import ConfigManager
@@ -18,12 +20,18 @@ from tootles.screens.explore import ExploreScreen
 from tootles.screens.help import HelpScreen
 from tootles.screens.notifications import NotificationsScreen
 from tootles.screens.settings import SettingsScreen
-from tootles.themes.manager import ThemeManager
 from tootles.widgets.compose import ComposeWidget
 from tootles.widgets.timeline import TimelineWidget
 
+if TYPE_CHECKING:
+    from tootles.themes.manager import ThemeManager
+
 logger = logging.getLogger(__name__)
 
+# Built-in themes in the order action_toggle_theme cycles through them
+THEME_CYCLE = ("standard", "dark", "light", "high-contrast")
+_NEXT_THEME = dict(zip(THEME_CYCLE, THEME_CYCLE[1:] + THEME_CYCLE[:1]))
+
 
 class TootlesApp(App):
     """Main Tootles application class."""
@@ -48,13 +56,30 @@ class TootlesApp(App):
         Binding("escape", "go_back", "Back"),
     ]
 
+    # Keys bound at the app level, for constant-time membership checks
+    BINDING_KEYS = frozenset(binding.key for binding in BINDINGS)
+
+    NOT_CONFIGURED_MESSAGE = "Please configure your Mastodon instance first"
+
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
-        self.theme_manager = ThemeManager(self.config_manager)
         self.media_manager = MediaManager(self.config_manager.config.media)
         self.api_client: Optional[MastodonClient] = None
         self.current_timeline = "home"
+        # Timelines mounted in the main content area, by timeline type
+        self._timelines: Dict[str, TimelineWidget] = {}
+
+    @cached_property
+    def theme_manager(self) -> "ThemeManager":
+        """Theme manager, created on first use.
+
+        Creating it scans the theme directories, and importing it pulls in
+        watchdog, so neither is done until a theme is needed.
+        """
+        from tootles.themes.manager import ThemeManager
+
+        return ThemeManager(self.config_manager)
 
     async def on_mount(self) -> None:
         """Initialize the application."""
@@ -76,35 +101,55 @@ class TootlesApp(App):
         # Load initial timeline data if we have an API client
         if self.api_client:
             await self._load_initial_timeline()
-    async def _load_home_timeline(self, timeline_type: str = "home", max_id: Optional[str] = None) -> List[Status]:
-        """Load statuses from the home timeline."""
+
+    async def on_unmount(self) -> None:
+        """Release pooled API connections and media resources on shutdown."""
+        await MastodonClient.close_all()
+        await self.media_manager.cleanup()
+
+    async def _load_home_timeline(
+        self,
+        direction: str = "home",
+        cursor_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Status]:
+        """Load a page of statuses from the home timeline.
+
+        "newer" loads the statuses directly after cursor_id, anything else the
+        ones before it. The page size defaults to the configured
+        timeline_limit.
+        """
         if not self.api_client:
             return []
 
+        if limit is None:
+            limit = self.config_manager.config.timeline_limit
+
         try:
-            return await self.api_client.get_home_timeline(max_id=max_id)
+            if direction == "newer":
+                return await self.api_client.get_home_timeline(
+                    min_id=cursor_id, limit=limit
+                )
+            return await self.api_client.get_home_timeline(max_id=cursor_id, limit=limit)
         except Exception as e:
             self.notify(f"Error loading timeline: {e}", severity="error")
             return []
 
     async def _load_initial_timeline(self) -> None:
         """Load initial timeline data after app initialization."""
-        try:
-            timeline_widget = self.query_one("#main-timeline", TimelineWidget)
-            timeline_widget.set_loading(True)
+        timeline_widget = self._timelines.get("home")
+        if timeline_widget is None:
+            return
 
+        timeline_widget.set_loading(True)
+        try:
             statuses = await self._load_home_timeline("home", None)
             if statuses:
                 timeline_widget.update_statuses(statuses)
         except Exception as e:
-            # Timeline widget might not exist yet or other error
             logger.debug(f"Failed to update timeline: {e}")
         finally:
-            try:
-                timeline_widget = self.query_one("#main-timeline", TimelineWidget)
-                timeline_widget.set_loading(False)
-            except Exception as e:
-                logger.debug(f"Failed to set timeline loading state: {e}")
+            timeline_widget.set_loading(False)
 
     def compose(self) -> ComposeResult:
         """Create the main application layout."""
@@ -119,12 +164,13 @@ class TootlesApp(App):
                 # Check config directly since api_client isn't created yet during compose
                 config = self.config_manager.config
                 if config.instance_url and config.access_token:
-                    yield TimelineWidget(
+                    self._timelines["home"] = TimelineWidget(
                         app_ref=self,
                         load_callback=self._load_home_timeline,
                         media_manager=self.media_manager,
-                        id="main-timeline"
+                        id="home-timeline"
                     )
+                    yield self._timelines["home"]
                 else:
                     yield Static(
                         "Welcome to Tootles!\n\n"
@@ -136,81 +182,51 @@ class TootlesApp(App):
 
         yield Footer()
 
+    def _require_client(self) -> bool:
+        """Return whether an API client is set up, warning the user if not."""
+        if self.api_client is None:
+            self.notify(self.NOT_CONFIGURED_MESSAGE, severity="warning")
+            return False
+        return True
+
     # Navigation Actions
     async def action_show_home(self) -> None:
         """Show home timeline."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
-        self.current_timeline = "home"
-        await self.replace_main_content(
-            TimelineWidget(
-                app_ref=self,
-                load_callback=self._load_home_timeline,
-                id="main-timeline"
-            )
-        )
+        await self.show_timeline("home", load_callback=self._load_home_timeline)
 
     def action_show_notifications(self) -> None:
         """Show notifications screen."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
         self.push_screen(NotificationsScreen(self))
 
     def action_show_explore(self) -> None:
         """Show explore screen."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
         self.push_screen(ExploreScreen(self))
 
     async def action_show_bookmarks(self) -> None:
         """Show bookmarks timeline."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
-        self.current_timeline = "bookmarks"
-        await self.replace_main_content(
-            TimelineWidget(
-                app_ref=self,
-                empty_message="No bookmarked posts yet.",
-                id="main-timeline"
-            )
+        await self.show_timeline(
+            "bookmarks", empty_message="No bookmarked posts yet."
         )
 
     async def action_show_favorites(self) -> None:
         """Show favorites timeline."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
-        self.current_timeline = "favorites"
-        await self.replace_main_content(
-            TimelineWidget(
-                app_ref=self,
-                empty_message="No favorite posts yet.",
-                id="main-timeline"
-            )
+        await self.show_timeline(
+            "favorites", empty_message="No favorite posts yet."
         )
 
     def action_show_lists(self) -> None:
@@ -219,11 +235,7 @@ class TootlesApp(App):
 
     def action_compose(self) -> None:
         """Show compose modal."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
         compose_widget = ComposeWidget(self)
@@ -235,11 +247,7 @@ class TootlesApp(App):
 
     def action_show_account(self) -> None:
         """Show account management screen."""
-        if not self.api_client:
-            self.notify(
-                "Please configure your Mastodon instance first",
-                severity="warning"
-            )
+        if not self._require_client():
             return
 
         self.push_screen(AccountScreen(self))
@@ -256,20 +264,17 @@ class TootlesApp(App):
     # Utility Actions
     def action_refresh(self) -> None:
         """Refresh current content."""
-        try:
-            timeline = self.query_one("#main-timeline", TimelineWidget)
-            self.run_worker(timeline.load_timeline())
-        except Exception:
+        timeline = self._timelines.get(self.current_timeline)
+        if timeline is None:
             self.notify("Nothing to refresh", severity="information")
+        else:
+            self.run_worker(timeline.load_timeline())
 
     async def action_toggle_theme(self) -> None:
         """Toggle between available themes."""
         config = self.config_manager.config
-        themes = ["standard", "dark", "light", "high-contrast"]
 
-        current_index = themes.index(config.theme) if config.theme in themes else 0
-        next_index = (current_index + 1) % len(themes)
-        next_theme = themes[next_index]
+        next_theme = _NEXT_THEME.get(config.theme, THEME_CYCLE[0])
 
         # Update config
         config.theme = next_theme
@@ -283,15 +288,43 @@ class TootlesApp(App):
 
         self.notify(f"Switched to {next_theme} theme", severity="success")
 
+    async def show_timeline(self, timeline_type: str, **kwargs) -> None:
+        """Show the timeline of the given type in the main content area.
+
+        Timelines are created on first use and then only hidden when another
+        one is shown, so switching back to them doesn't rebuild and reload
+        them. Keyword arguments are passed to TimelineWidget on creation.
+        """
+        self.current_timeline = timeline_type
+        main_content = self.query_one("#main-content", Vertical)
+
+        timeline = self._timelines.get(timeline_type)
+        for child in main_content.children:
+            child.display = child is timeline
+
+        if timeline is None:
+            timeline = TimelineWidget(
+                app_ref=self,
+                timeline_type=timeline_type,
+                id=f"{timeline_type}-timeline",
+                **kwargs
+            )
+            self._timelines[timeline_type] = timeline
+            await main_content.mount(timeline)
+
     async def replace_main_content(self, new_widget) -> None:
         """Replace the main content area with a new widget."""
         main_content = self.query_one("#main-content", Vertical)
         await main_content.remove_children()
+        self._timelines.clear()
         main_content.mount(new_widget)
 
     async def reload_api_client(self) -> None:
         """Reload API client after configuration changes."""
         config = self.config_manager.config
+        if self.api_client:
+            await self.api_client.close()
+
         if config.instance_url and config.access_token:
             self.api_client = MastodonClient(
                 instance_url=config.instance_url,
@@ -300,17 +333,15 @@ class TootlesApp(App):
 
             # Replace welcome message with timeline if we were showing it
             try:
-                self.query_one("#welcome-message")
-                await self.replace_main_content(
-                    TimelineWidget(
-                        app_ref=self,
-                        load_callback=self._load_home_timeline,
-                        id="main-timeline"
-                    )
-                )
+                welcome = self.query_one("#welcome-message")
             except NoMatches:
                 # Welcome message not shown, nothing to replace
                 pass
+            else:
+                await welcome.remove()
+                await self.show_timeline(
+                    "home", load_callback=self._load_home_timeline
+                )
         else:
             self.api_client = None
 
@@ -321,7 +352,7 @@ def main(config_path=None):
     if config_path:
         # TODO: Pass config_path to app when config loading is implemented
         pass
-    app.run()
+    run(app.run_async())
 
 
 if __name__ == "__main__":
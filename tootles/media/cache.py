@@ -3,22 +3,55 @@
 import asyncio
 import hashlib
 import logging
-import time
+import os
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import aiofiles
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Fraction of its maximum size that the disk cache is cleaned up to
+CLEANUP_TARGET = 0.9
+
+# Number of recently read disk cache files whose access order is tracked in
+# memory
+RECENT_FILES_MAX = 1024
+
+# Full media smaller than this is kept in memory, larger media on disk
+MEMORY_MEDIA_MAX_SIZE = 1024 * 1024
+
 
 class MediaCacheError(Exception):
     """Base exception for cache operations."""
     pass
 
 
+@lru_cache(maxsize=2048)
+def _cache_file_name(key: str) -> str:
+    """Get the disk cache file name for key.
+
+    Timelines request the same URLs (e.g. avatars) over and over, so the
+    names are memoized rather than re-encoded and re-hashed on every lookup.
+    """
+    # Not security sensitive, so use a short and fast BLAKE2b digest; files
+    # named by older digests age out.
+    hash_key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return f"{hash_key}.cache"
+
+
 class MemoryCache:
-    """In-memory LRU cache for thumbnails and small media."""
+    """In-memory LRU cache for thumbnails and small media.
+
+    Operations never await, so they are atomic on the event loop and need no
+    lock.
+    """
+
+    # Hit on every media lookup while scrolling; slots keep attribute access
+    # cheap
+    __slots__ = ("maxsize", "max_item_size", "cache", "current_size")
 
     def __init__(self, maxsize: int = 50):
         """Initialize memory cache.
@@ -27,12 +60,13 @@ class MemoryCache:
             maxsize: Maximum cache size in MB
         """
         self.maxsize = maxsize * 1024 * 1024  # Convert to bytes
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_times: Dict[str, float] = {}
+        # Larger items would evict too much of the rest of the cache
+        self.max_item_size = self.maxsize // 8
+        # Data by key, least recently used first
+        self.cache: OrderedDict[str, bytes] = OrderedDict()
         self.current_size = 0
-        self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> Optional[bytes]:
+    def get(self, key: str) -> Optional[bytes]:
         """Get item from cache.
 
         Args:
@@ -41,56 +75,44 @@ class MemoryCache:
         Returns:
             Cached data or None if not found
         """
-        async with self._lock:
-            if key in self.cache:
-                self.access_times[key] = time.time()
-                return self.cache[key]['data']
-            return None
+        data = self.cache.get(key)
+        if data is not None:
+            self.cache.move_to_end(key)
+        return data
 
-    async def set(self, key: str, data: bytes) -> None:
+    def set(self, key: str, data: bytes) -> None:
         """Set item in cache.
 
         Args:
             key: Cache key
             data: Data to cache
         """
-        async with self._lock:
-            data_size = len(data)
-
-            # Check if we need to evict items
-            while (self.current_size + data_size > self.maxsize and
-                   len(self.cache) > 0):
-                await self._evict_lru()
-
-            # Only cache if data fits
-            if data_size <= self.maxsize:
-                self.cache[key] = {
-                    'data': data,
-                    'size': data_size,
-                    'timestamp': time.time()
-                }
-                self.access_times[key] = time.time()
-                self.current_size += data_size
-
-    async def _evict_lru(self) -> None:
-        """Evict least recently used item."""
-        if not self.access_times:
+        data_size = len(data)
+
+        # Replace rather than duplicate an existing entry
+        old = self.cache.pop(key, None)
+        if old is not None:
+            self.current_size -= len(old)
+
+        if data_size > self.max_item_size:
             return
 
-        lru_key = min(self.access_times.keys(),
-                     key=lambda k: self.access_times[k])
+        # Check if we need to evict items
+        while self.current_size + data_size > self.maxsize and self.cache:
+            self._evict_lru()
 
-        if lru_key in self.cache:
-            self.current_size -= self.cache[lru_key]['size']
-            del self.cache[lru_key]
-            del self.access_times[lru_key]
+        self.cache[key] = data
+        self.current_size += data_size
 
-    async def clear(self) -> None:
+    def _evict_lru(self) -> None:
+        """Evict least recently used item."""
+        _, data = self.cache.popitem(last=False)
+        self.current_size -= len(data)
+
+    def clear(self) -> None:
         """Clear all cached items."""
-        async with self._lock:
-            self.cache.clear()
-            self.access_times.clear()
-            self.current_size = 0
+        self.cache.clear()
+        self.current_size = 0
 
 
 class DiskCache:
@@ -107,6 +129,19 @@ class DiskCache:
         self.max_size = max_size_mb * 1024 * 1024  # Convert to bytes
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = asyncio.Lock()
+        # Total size of the cache files, computed on first use and then kept
+        # up to date by set(); None when it needs to be recomputed
+        self._current_size: Optional[int] = None
+        self._cleanup_task: Optional[asyncio.Future[None]] = None
+        # Paths of recently read or written files, least recent first.
+        # Access order is tracked here, and a file's access time is only
+        # updated when it enters this list, not on every read.
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        # Cache file I/O gets threads of its own, so it doesn't queue behind
+        # thumbnail generation in the loop's default executor
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="tootles-cache-io"
+        )
 
     def _get_cache_path(self, key: str) -> Path:
         """Get cache file path for key.
@@ -117,9 +152,7 @@ class DiskCache:
         Returns:
             Path to cache file
         """
-        # Use hash to create safe filename
-        hash_key = hashlib.sha256(key.encode()).hexdigest()
-        return self.cache_dir / f"{hash_key}.cache"
+        return self.cache_dir / _cache_file_name(key)
 
     async def get(self, key: str) -> Optional[bytes]:
         """Get item from disk cache.
@@ -131,17 +164,22 @@ class DiskCache:
             Cached data or None if not found
         """
         cache_path = self._get_cache_path(key)
+        loop = asyncio.get_running_loop()
 
-        try:
-            if cache_path.exists():
-                async with aiofiles.open(cache_path, 'rb') as f:
-                    data = await f.read()
+        path = str(cache_path)
+        touch = path not in self._recent
 
-                # Update access time
-                cache_path.touch()
-                return data
+        try:
+            data = await loop.run_in_executor(
+                self._io_pool, self._read_file, cache_path, touch
+            )
+            self._mark_recent(path)
+            return data
+        except FileNotFoundError:
+            pass
         except Exception:
             # Remove corrupted cache file
+            self._current_size = None
             try:
                 cache_path.unlink(missing_ok=True)
             except Exception as e:
@@ -149,6 +187,26 @@ class DiskCache:
 
         return None
 
+    def _mark_recent(self, path: str) -> None:
+        """Record an access to a cache file."""
+        self._recent[path] = None
+        self._recent.move_to_end(path)
+        if len(self._recent) > RECENT_FILES_MAX:
+            self._recent.popitem(last=False)
+
+    @staticmethod
+    def _read_file(cache_path: Path, touch: bool) -> bytes:
+        """Read a cache file, in a worker thread.
+
+        Args:
+            cache_path: Cache file path
+            touch: Whether to update the file's access time
+        """
+        data = cache_path.read_bytes()
+        if touch:
+            cache_path.touch()
+        return data
+
     async def set(self, key: str, data: bytes) -> None:
         """Set item in disk cache.
 
@@ -160,56 +218,150 @@ class DiskCache:
             cache_path = self._get_cache_path(key)
 
             try:
-                # Check if we need to clean up space
-                await self._cleanup_if_needed(len(data))
-
                 # Write to temporary file first, then rename for atomicity
                 temp_path = cache_path.with_suffix('.tmp')
-                async with aiofiles.open(temp_path, 'wb') as f:
-                    await f.write(data)
-
-                temp_path.rename(cache_path)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._io_pool, temp_path.write_bytes, data)
+                self._commit(temp_path, cache_path, len(data))
 
             except Exception as e:
                 # Clean up temp file if it exists
                 try:
                     temp_path.unlink(missing_ok=True)
-                except Exception as e:
-                    logger.debug(f"Failed to clean up temp file {temp_path}: {e}")
+                except Exception as cleanup_error:
+                    logger.debug(f"Failed to clean up temp file {temp_path}: {cleanup_error}")
                 raise MediaCacheError(f"Failed to cache data: {e}") from e
 
-    async def _cleanup_if_needed(self, new_data_size: int) -> None:
-        """Clean up cache if needed to make space.
+    async def set_stream(self, key: str, chunks: AsyncIterable[bytes]) -> None:
+        """Write data to the disk cache as it arrives.
+
+        Chunks are written out one by one, so the cache file is complete as
+        soon as the last chunk is received. Errors raised while iterating the
+        chunks propagate unchanged.
 
         Args:
-            new_data_size: Size of new data to be cached
+            key: Cache key
+            chunks: Data to cache, in chunks
         """
-        current_size = await self._get_cache_size()
+        cache_path = self._get_cache_path(key)
+        temp_path: Optional[Path] = None
+        loop = asyncio.get_running_loop()
+        size = 0
 
-        if current_size + new_data_size > self.max_size:
-            # Get all cache files sorted by access time (oldest first)
-            cache_files = []
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    stat = cache_file.stat()
-                    cache_files.append((cache_file, stat.st_atime, stat.st_size))
-                except Exception as e:
-                    logger.debug(f"Failed to get file stats for {cache_file}: {e}")
-                    continue
+        try:
+            fd, temp_name = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+            temp_path = Path(temp_name)
+            with open(fd, 'wb') as f:
+                async for chunk in chunks:
+                    await loop.run_in_executor(self._io_pool, f.write, chunk)
+                    size += len(chunk)
 
-            cache_files.sort(key=lambda x: x[1])  # Sort by access time
+            async with self._lock:
+                self._commit(temp_path, cache_path, size)
 
-            # Remove files until we have enough space
-            for cache_file, _, file_size in cache_files:
-                if current_size + new_data_size <= self.max_size:
-                    break
+        except BaseException as e:
+            try:
+                if temp_path is not None:
+                    temp_path.unlink(missing_ok=True)
+            except Exception as cleanup_error:
+                logger.debug(f"Failed to clean up temp file {temp_path}: {cleanup_error}")
+            if isinstance(e, OSError):
+                raise MediaCacheError(f"Failed to cache data: {e}") from e
+            raise
 
-                try:
-                    cache_file.unlink()
-                    current_size -= file_size
-                except Exception as e:
-                    logger.debug(f"Failed to get file stats for {cache_file}: {e}")
-                    continue
+    def _commit(self, temp_path: Path, cache_path: Path, size: int) -> None:
+        """Move a complete file into place and account for its size.
+
+        Args:
+            temp_path: Complete file, on the cache's filesystem
+            cache_path: Cache file path to replace
+            size: Size of the file in bytes
+        """
+        try:
+            replaced_size = cache_path.stat().st_size
+        except FileNotFoundError:
+            replaced_size = 0
+
+        os.replace(temp_path, cache_path)
+        self._mark_recent(str(cache_path))
+        if self._current_size is not None:
+            self._current_size += size - replaced_size
+        self._schedule_cleanup()
+
+    def _schedule_cleanup(self) -> None:
+        """Start a background cleanup if the cache has grown too large.
+
+        Cleanup stays off the write path: writes only update the running
+        total, and a single task brings the cache back under its limit.
+        """
+        if self._current_size is not None and self._current_size <= self.max_size:
+            return
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.ensure_future(self._cleanup())
+            self._cleanup_task.add_done_callback(self._cleanup_done)
+
+    def _cleanup_done(self, task: asyncio.Future) -> None:
+        """Log a failed background cleanup and forget the finished task."""
+        if self._cleanup_task is task:
+            self._cleanup_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Disk cache cleanup failed: {task.exception()}")
+
+    async def _cleanup(self) -> None:
+        """Remove least recently accessed files until the cache fits.
+
+        Files are removed down to CLEANUP_TARGET of the maximum size, so that
+        the next few writes don't immediately trigger another cleanup.
+        """
+        async with self._lock:
+            if await self._get_cache_size() <= self.max_size:
+                return
+
+            recent = {path: index for index, path in enumerate(self._recent)}
+            loop = asyncio.get_running_loop()
+            self._current_size, removed = await loop.run_in_executor(
+                self._io_pool,
+                self._remove_least_recent,
+                recent,
+                self.max_size * CLEANUP_TARGET,
+            )
+            for path in removed:
+                self._recent.pop(path, None)
+
+    def _remove_least_recent(
+        self, recent: Dict[str, int], target_size: float
+    ) -> Tuple[int, List[str]]:
+        """Remove cache files down to target_size, in a worker thread.
+
+        Args:
+            recent: Recently used paths, mapped to their rank in self._recent
+            target_size: Cache size to remove files down to
+
+        Returns:
+            The remaining cache size and the removed paths
+        """
+        # Rescan, which also corrects the running total for any files
+        # changed behind our back, then remove files that weren't used
+        # recently by access time (oldest first), and then recently used
+        # ones in the order they were used
+        cache_files = self._scan_cache_files()
+        current_size = sum(size for _, _, size in cache_files)
+        cache_files.sort(key=lambda x: (recent.get(x[0], -1), x[1]))
+
+        removed = []
+        for path, _, file_size in cache_files:
+            if current_size <= target_size:
+                break
+
+            try:
+                os.unlink(path)
+            except OSError as e:
+                logger.debug(f"Failed to remove cache file {path}: {e}")
+                continue
+            current_size -= file_size
+            removed.append(path)
+
+        return current_size, removed
 
     async def _get_cache_size(self) -> int:
         """Get current cache size in bytes.
@@ -217,24 +369,64 @@ class DiskCache:
         Returns:
             Total cache size in bytes
         """
-        total_size = 0
-        for cache_file in self.cache_dir.glob("*.cache"):
-            try:
-                total_size += cache_file.stat().st_size
-            except Exception as e:
-                logger.debug(f"Failed to get file size for {cache_file}: {e}")
-                continue
-        return total_size
+        if self._current_size is None:
+            loop = asyncio.get_running_loop()
+            cache_files = await loop.run_in_executor(
+                self._io_pool, self._scan_cache_files
+            )
+            self._current_size = sum(size for _, _, size in cache_files)
+        return self._current_size
+
+    def _scan_cache_files(self) -> List[Tuple[str, float, int]]:
+        """List cache files in a single directory pass, in a worker thread.
+
+        Returns:
+            (path, access time, size) for each cache file
+        """
+        cache_files = []
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".cache"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.debug(f"Failed to get file stats for {entry.path}: {e}")
+                    continue
+                cache_files.append((entry.path, stat.st_atime, stat.st_size))
+        return cache_files
+
+    def close(self) -> None:
+        """Shut down the I/O threads.
+
+        The cache can't be used afterwards.
+        """
+        self._io_pool.shutdown(wait=False)
 
     async def clear(self) -> None:
         """Clear all cached files."""
         async with self._lock:
-            for cache_file in self.cache_dir.glob("*.cache"):
-                try:
-                    cache_file.unlink()
-                except Exception as e:
-                    logger.debug(f"Failed to get file stats for {cache_file}: {e}")
-                    continue
+            loop = asyncio.get_running_loop()
+            remaining = await loop.run_in_executor(self._io_pool, self._remove_cache_files)
+            self._current_size = remaining
+            self._recent.clear()
+
+    def _remove_cache_files(self) -> int:
+        """Remove all cache files in a single directory pass, in a worker thread.
+
+        Returns:
+            Total size of the files that could not be removed
+        """
+        remaining = 0
+        for path, _, size in self._scan_cache_files():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Failed to remove cache file {path}: {e}")
+                remaining += size
+        return remaining
 
 
 class MediaCache:
@@ -253,21 +445,20 @@ class MediaCache:
             disk_cache_mb: Disk cache size in MB
             cache_dir: Disk cache directory
         """
-        self.memory_cache = MemoryCache(memory_cache_mb)
+        # Thumbnails get a memory tier of their own, so that small full media
+        # doesn't evict them. With separate tiers, URLs are used as keys as-is.
+        thumbnail_cache_mb = max(1, memory_cache_mb // 5)
+        self.thumbnail_cache = MemoryCache(thumbnail_cache_mb)
+        self.memory_cache = MemoryCache(max(1, memory_cache_mb - thumbnail_cache_mb))
         self.disk_cache = DiskCache(cache_dir, disk_cache_mb)
-
-    def _get_cache_key(self, url: str, is_thumbnail: bool = False) -> str:
-        """Generate cache key for URL.
-
-        Args:
-            url: Media URL
-            is_thumbnail: Whether this is a thumbnail
-
-        Returns:
-            Cache key
-        """
-        prefix = "thumb_" if is_thumbnail else "full_"
-        return f"{prefix}{url}"
+        # Media from this size up goes to disk. A small memory tier takes
+        # smaller items than MEMORY_MEDIA_MAX_SIZE, and the ones it would
+        # refuse have to go to disk too, or they wouldn't be cached at all.
+        self._disk_media_min_size = min(
+            MEMORY_MEDIA_MAX_SIZE, self.memory_cache.max_item_size + 1
+        )
+        # Fetches in progress by cache key, shared by concurrent misses
+        self._inflight: Dict[str, asyncio.Future[Optional[bytes]]] = {}
 
     async def get_thumbnail(self, url: str) -> Optional[bytes]:
         """Get thumbnail from memory cache.
@@ -278,8 +469,7 @@ class MediaCache:
         Returns:
             Thumbnail data or None
         """
-        key = self._get_cache_key(url, is_thumbnail=True)
-        return await self.memory_cache.get(key)
+        return self.thumbnail_cache.get(url)
 
     async def get_full_media(self, url: str) -> Optional[bytes]:
         """Get full media from disk cache with memory fallback.
@@ -290,15 +480,81 @@ class MediaCache:
         Returns:
             Media data or None
         """
-        key = self._get_cache_key(url, is_thumbnail=False)
-
         # Try memory cache first (for smaller files)
-        data = await self.memory_cache.get(key)
+        data = self.memory_cache.get(url)
         if data:
             return data
 
         # Fall back to disk cache
-        return await self.disk_cache.get(key)
+        return await self.disk_cache.get(url)
+
+    async def fetch_full_media(
+        self,
+        url: str,
+        fetch: Callable[[str], AsyncIterator[bytes]]
+    ) -> Optional[bytes]:
+        """Fetch full media that is not cached, and store it.
+
+        Concurrent calls for the same URL share a single fetch. Large media is
+        written to the disk cache while it is still downloading.
+
+        Args:
+            url: Media URL
+            fetch: Function streaming the media for a URL, in chunks
+
+        Returns:
+            Media data or None
+        """
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(url, fetch))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+
+        # Shield the shared fetch, so a cancelled caller doesn't cancel it for
+        # the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        url: str,
+        fetch: Callable[[str], AsyncIterator[bytes]]
+    ) -> Optional[bytes]:
+        """Fetch media and store it in the cache."""
+        stream = fetch(url)
+        chunks: List[bytes] = []
+        size = 0
+
+        # Buffer until the media turns out to be too large for memory
+        async for chunk in stream:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self._disk_media_min_size:
+                break
+        else:
+            data = b"".join(chunks)
+            if data:
+                self.memory_cache.set(url, data)
+            return data or None
+
+        async def spill() -> AsyncIterator[bytes]:
+            # Hand the buffered chunks to the disk cache, then the rest of
+            # the download as it arrives
+            for chunk in chunks[:]:
+                yield chunk
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+
+        try:
+            await self.disk_cache.set_stream(url, spill())
+        except MediaCacheError as e:
+            # Caching failed, but the download can still be used
+            logger.debug(f"Failed to cache {url}: {e}")
+            async for chunk in stream:
+                chunks.append(chunk)
+
+        return b"".join(chunks)
 
     async def store_thumbnail(self, url: str, data: bytes) -> None:
         """Store thumbnail in memory cache.
@@ -307,8 +563,7 @@ class MediaCache:
             url: Media URL
             data: Thumbnail data
         """
-        key = self._get_cache_key(url, is_thumbnail=True)
-        await self.memory_cache.set(key, data)
+        self.thumbnail_cache.set(url, data)
 
     async def store_full_media(self, url: str, data: bytes) -> None:
         """Store full media using appropriate cache tier.
@@ -317,15 +572,18 @@ class MediaCache:
             url: Media URL
             data: Media data
         """
-        key = self._get_cache_key(url, is_thumbnail=False)
-
         # Store small files in memory, large files on disk
-        if len(data) < 1024 * 1024:  # < 1MB
-            await self.memory_cache.set(key, data)
+        if len(data) < self._disk_media_min_size:
+            self.memory_cache.set(url, data)
         else:
-            await self.disk_cache.set(key, data)
+            await self.disk_cache.set(url, data)
+
+    def close(self) -> None:
+        """Release the cache's resources."""
+        self.disk_cache.close()
 
     async def clear_all(self) -> None:
         """Clear all caches."""
-        await self.memory_cache.clear()
+        self.thumbnail_cache.clear()
+        self.memory_cache.clear()
         await self.disk_cache.clear()
@@ -1,16 +1,61 @@
 """External viewer integration for media files."""
 
 import asyncio
+import hashlib
 import logging
+import os
+import shlex
 import shutil
 import tempfile
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .formats import MediaFormat, get_media_format
 
 logger = logging.getLogger(__name__)
 
+# Temporary files kept for re-opening the same media
+TEMP_FILES_MAX = 16
+
+
+@lru_cache(maxsize=64)
+def _which(cmd: str) -> Optional[str]:
+    """Locate a command on PATH, once per command.
+
+    Each lookup stats candidates in every PATH directory, and viewer
+    availability is checked again and again.
+    """
+    return shutil.which(cmd)
+
+
+def _digest(data: bytes) -> bytes:
+    """Identify media data for reusing its temporary file."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _split_command(viewer_cmd: str) -> List[str]:
+    """Split a viewer command into argv, honouring shell quoting."""
+    try:
+        return shlex.split(viewer_cmd)
+    except ValueError:
+        # Unbalanced quotes, split on whitespace as before
+        return viewer_cmd.split()
+
+
+# Viewer config key by media format
+VIEWER_TYPES = {
+    MediaFormat.IMAGE: 'image',
+    MediaFormat.VIDEO: 'video',
+    MediaFormat.AUDIO: 'audio',
+}
+
+
+def _media_type(url: str) -> Optional[str]:
+    """Get the viewer config key ('image', 'video', 'audio') for media URL."""
+    return VIEWER_TYPES.get(get_media_format(url))
+
 
 class ExternalViewerError(Exception):
     """Exception raised when external viewer operations fail."""
@@ -27,7 +72,19 @@ class ExternalViewerManager:
             viewer_config: Dict mapping media types to viewer commands
         """
         self.viewers = viewer_config or self._get_default_viewers()
-        self._temp_files: list[Path] = []
+        # Temporary files by (suffix, digest of the data), least recently
+        # opened first, so opening the same media again reuses its file
+        self._temp_files: OrderedDict[Tuple[str, bytes], Path] = OrderedDict()
+        # Files no longer reused, kept until cleanup since a viewer may still
+        # be about to open them (xdg-open hands the path on asynchronously)
+        self._stale_temp_files: List[Path] = []
+        # Viewer commands split into argv once, by media type
+        self._argv: Dict[str, List[str]] = {
+            media_type: _split_command(viewer_cmd)
+            for media_type, viewer_cmd in self.viewers.items()
+        }
+        # Whether each media type's viewer is installed, checked once
+        self._available: Dict[str, bool] = {}
 
     def _get_default_viewers(self) -> Dict[str, str]:
         """Get default external viewers based on available programs.
@@ -39,19 +96,19 @@ class ExternalViewerManager:
 
         # Image viewers
         for viewer in ['feh', 'eog', 'xviewer', 'gwenview', 'ristretto']:
-            if shutil.which(viewer):
+            if _which(viewer):
                 viewers['image'] = viewer
                 break
 
         # Video/audio players
         for player in ['mpv', 'vlc', 'mplayer', 'totem']:
-            if shutil.which(player):
+            if _which(player):
                 viewers['video'] = player
                 viewers['audio'] = player
                 break
 
         # Fallback to xdg-open
-        if shutil.which('xdg-open'):
+        if _which('xdg-open'):
             if 'image' not in viewers:
                 viewers['image'] = 'xdg-open'
             if 'video' not in viewers:
@@ -70,16 +127,11 @@ class ExternalViewerManager:
         Returns:
             Viewer command or None if no viewer available
         """
-        media_format = get_media_format(url)
-
-        if media_format == MediaFormat.IMAGE:
-            return self.viewers.get('image')
-        elif media_format == MediaFormat.VIDEO:
-            return self.viewers.get('video')
-        elif media_format == MediaFormat.AUDIO:
-            return self.viewers.get('audio')
+        return self.viewers.get(_media_type(url))
 
-        return None
+    def _get_argv_for_url(self, url: str) -> List[str]:
+        """Get the viewer argv for media URL, empty if no viewer available."""
+        return self._argv.get(_media_type(url)) or []
 
     async def open_media(self, url: str, media_data: Optional[bytes] = None) -> bool:
         """Open media in external viewer.
@@ -91,99 +143,122 @@ class ExternalViewerManager:
         Returns:
             True if successfully opened
         """
-        viewer_cmd = self.get_viewer_for_url(url)
-        if not viewer_cmd:
+        viewer_argv = self._get_argv_for_url(url)
+        if not viewer_argv:
             logger.warning(f"No external viewer available for {url}")
             return False
 
         try:
             if media_data:
                 # Save to temporary file and open
-                return await self._open_from_data(viewer_cmd, url, media_data)
+                return await self._open_from_data(viewer_argv, url, media_data)
             else:
                 # Open URL directly
-                return await self._open_from_url(viewer_cmd, url)
+                return await self._open_from_url(viewer_argv, url)
         except Exception as e:
             logger.error(f"Failed to open media in external viewer: {e}")
             raise ExternalViewerError(f"Failed to open media: {e}") from e
 
-    async def _open_from_data(self, viewer_cmd: str, url: str, data: bytes) -> bool:
+    async def _open_from_data(self, viewer_argv: List[str], url: str, data: bytes) -> bool:
         """Open media from data using temporary file.
 
         Args:
-            viewer_cmd: Viewer command
+            viewer_argv: Viewer command and arguments
             url: Original URL (for file extension)
             data: Media data
 
         Returns:
             True if successfully opened
         """
-        # Create temporary file with appropriate extension
+        # Hashing and writing up to 50MB of media would stall the UI, do it in
+        # a thread
+        loop = asyncio.get_running_loop()
         suffix = Path(url).suffix or '.tmp'
+        digest = await loop.run_in_executor(None, _digest, data)
+        key = (suffix, digest)
+
+        temp_file = self._temp_files.get(key)
+        if temp_file is not None and temp_file.exists():
+            self._temp_files.move_to_end(key)
+        else:
+            temp_file = await loop.run_in_executor(None, self._write_temp, suffix, data)
+            self._temp_files[key] = temp_file
+            while len(self._temp_files) > TEMP_FILES_MAX:
+                _, old_file = self._temp_files.popitem(last=False)
+                self._stale_temp_files.append(old_file)
+
+        opened = await self._execute_viewer(viewer_argv, str(temp_file))
+        if not opened:
+            # No viewer has the file, so it can go right away
+            self._temp_files.pop(key, None)
+            self._remove_temp_file(temp_file)
+        return opened
+
+    @staticmethod
+    def _write_temp(suffix: str, data: bytes) -> Path:
+        """Write media data to a new temporary file, in a worker thread.
+
+        Args:
+            suffix: File extension, with the dot
+            data: Media data
+
+        Returns:
+            Path of the temporary file
+        """
+        # Create temporary file with appropriate extension
         fd, temp_path = tempfile.mkstemp(suffix=suffix)
         temp_file = Path(temp_path)
 
         try:
-            # Close the file descriptor and write data to temporary file
-            import os
-            os.close(fd)
-            temp_file.write_bytes(data)
-            self._temp_files.append(temp_file)
+            # Write through the descriptor mkstemp opened
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
 
-            # Open with viewer
-            return await self._execute_viewer(viewer_cmd, str(temp_file))
+        return temp_file
 
-        except Exception as e:
-            # Clean up temp file on error
-            try:
-                temp_file.unlink(missing_ok=True)
-                if temp_file in self._temp_files:
-                    self._temp_files.remove(temp_file)
-            except Exception as cleanup_error:
-                logger.debug(f"Failed to clean up temp file {temp_file}: {cleanup_error}")
-            raise e
-
-    async def _open_from_url(self, viewer_cmd: str, url: str) -> bool:
+    async def _open_from_url(self, viewer_argv: List[str], url: str) -> bool:
         """Open media directly from URL.
 
         Args:
-            viewer_cmd: Viewer command
+            viewer_argv: Viewer command and arguments
             url: Media URL
 
         Returns:
             True if successfully opened
         """
-        return await self._execute_viewer(viewer_cmd, url)
+        return await self._execute_viewer(viewer_argv, url)
 
-    async def _execute_viewer(self, viewer_cmd: str, target: str) -> bool:
+    async def _execute_viewer(self, viewer_argv: List[str], target: str) -> bool:
         """Execute viewer command.
 
         Args:
-            viewer_cmd: Viewer command
+            viewer_argv: Viewer command and arguments
             target: File path or URL to open
 
         Returns:
             True if successfully executed
         """
         try:
-            # Split command to handle arguments
-            cmd_parts = viewer_cmd.split()
-            cmd_parts.append(target)
-
             # Execute in background (don't wait for completion)
             process = await asyncio.create_subprocess_exec(
-                *cmd_parts,
+                *viewer_argv,
+                target,
+                # Keep the viewer off the terminal the app is reading from
+                stdin=asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
                 start_new_session=True  # Detach from parent
             )
 
             # Don't wait for the viewer to close
-            logger.debug(f"Opened {target} with {viewer_cmd} (PID: {process.pid})")
+            logger.debug(f"Opened {target} with {viewer_argv[0]} (PID: {process.pid})")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to execute viewer command '{viewer_cmd}': {e}")
+            logger.error(f"Failed to execute viewer '{viewer_argv[0]}': {e}")
             return False
 
     def is_viewer_available(self, media_type: str) -> bool:
@@ -195,13 +270,18 @@ class ExternalViewerManager:
         Returns:
             True if viewer is available
         """
-        viewer_cmd = self.viewers.get(media_type)
-        if not viewer_cmd:
-            return False
+        available = self._available.get(media_type)
+        if available is None:
+            # Check if command exists
+            viewer_argv = self._argv.get(media_type)
+            available = bool(viewer_argv) and _which(viewer_argv[0]) is not None
+            self._available[media_type] = available
+        return available
 
-        # Check if command exists
-        cmd_name = viewer_cmd.split()[0]
-        return shutil.which(cmd_name) is not None
+    def invalidate_availability(self) -> None:
+        """Forget which viewers were found, e.g. after installing one."""
+        self._available.clear()
+        _which.cache_clear()
 
     def get_available_viewers(self) -> Dict[str, str]:
         """Get dict of available viewers.
@@ -217,12 +297,19 @@ class ExternalViewerManager:
 
     def cleanup_temp_files(self) -> None:
         """Clean up temporary files created for external viewers."""
-        for temp_file in self._temp_files[:]:
-            try:
-                temp_file.unlink(missing_ok=True)
-                self._temp_files.remove(temp_file)
-            except Exception as e:
-                logger.debug(f"Failed to clean up temp file {temp_file}: {e}")
+        while self._temp_files:
+            _, temp_file = self._temp_files.popitem()
+            self._remove_temp_file(temp_file)
+        while self._stale_temp_files:
+            self._remove_temp_file(self._stale_temp_files.pop())
+
+    @staticmethod
+    def _remove_temp_file(temp_file: Path) -> None:
+        """Remove a temporary file, logging rather than raising failures."""
+        try:
+            temp_file.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug(f"Failed to clean up temp file {temp_file}: {e}")
 
     def __del__(self):
         """Cleanup on destruction."""
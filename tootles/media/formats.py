@@ -1,9 +1,8 @@
 """Media format detection and validation."""
 
-import mimetypes
 from enum import Enum
-from pathlib import Path
-from typing import Optional, Set
+from functools import lru_cache
+from typing import Dict, Optional, Set
 
 
 class MediaFormat(Enum):
@@ -46,54 +45,66 @@ class MediaFormatConfig:
     }
 
 
+def _format_table(image: Set[str], video: Set[str], audio: Set[str]) -> Dict[str, MediaFormat]:
+    """Build a flat lookup table from the per-format sets."""
+    table = dict.fromkeys(image, MediaFormat.IMAGE)
+    table.update(dict.fromkeys(video, MediaFormat.VIDEO))
+    table.update(dict.fromkeys(audio, MediaFormat.AUDIO))
+    return table
+
+
+# Single-lookup tables, by MIME type, by file extension and by MIME top-level
+# type
+_MIME_TO_FORMAT = _format_table(
+    MediaFormatConfig.IMAGE_MIMETYPES,
+    MediaFormatConfig.VIDEO_MIMETYPES,
+    MediaFormatConfig.AUDIO_MIMETYPES,
+)
+_EXT_TO_FORMAT = _format_table(
+    MediaFormatConfig.SUPPORTED_IMAGE_FORMATS,
+    MediaFormatConfig.SUPPORTED_VIDEO_FORMATS,
+    MediaFormatConfig.SUPPORTED_AUDIO_FORMATS,
+)
+_TYPE_TO_FORMAT = _format_table({"image"}, {"video"}, {"audio"})
+# Mastodon attachment types, which callers pass in place of a MIME type
+_ATTACHMENT_TYPE_TO_FORMAT = {**_TYPE_TO_FORMAT, "gifv": MediaFormat.VIDEO}
+
+
+@lru_cache(maxsize=1024)
 def get_media_format(url: str, mimetype: Optional[str] = None) -> MediaFormat:
     """Determine media format from URL and/or mimetype.
 
+    Results are cached, since the same attachments are checked over and over
+    while rendering, preloading and opening media.
+
     Args:
         url: Media URL
-        mimetype: Optional MIME type
+        mimetype: Optional MIME type, or Mastodon attachment type (e.g. "image")
 
     Returns:
         MediaFormat enum value
     """
-    # First try mimetype if provided
-    if mimetype:
-        if mimetype in MediaFormatConfig.IMAGE_MIMETYPES:
-            return MediaFormat.IMAGE
-        elif mimetype in MediaFormatConfig.VIDEO_MIMETYPES:
-            return MediaFormat.VIDEO
-        elif mimetype in MediaFormatConfig.AUDIO_MIMETYPES:
-            return MediaFormat.AUDIO
-
-    # Fall back to file extension
-    try:
-        path = Path(url)
-        extension = path.suffix.lower().lstrip('.')
-
-        if extension in MediaFormatConfig.SUPPORTED_IMAGE_FORMATS:
-            return MediaFormat.IMAGE
-        elif extension in MediaFormatConfig.SUPPORTED_VIDEO_FORMATS:
-            return MediaFormat.VIDEO
-        elif extension in MediaFormatConfig.SUPPORTED_AUDIO_FORMATS:
-            return MediaFormat.AUDIO
-    except (ValueError, OSError):
-        # Failed to parse URL or determine format from URL - continue to fallback detection
-        pass
-
-    # Try mimetypes module as last resort
+    # First try mimetype if provided, then fall back to file extension
+    media_format = (
+        _MIME_TO_FORMAT.get(mimetype)
+        or _ATTACHMENT_TYPE_TO_FORMAT.get(mimetype)
+        or _EXT_TO_FORMAT.get(_ext(url))
+    )
+    if media_format:
+        return media_format
+
+    # Try mimetypes module as last resort. It reads the system MIME tables on
+    # first use, so only import it when it is needed.
+    import mimetypes
+
     try:
         guessed_type, _ = mimetypes.guess_type(url)
-        if guessed_type:
-            if guessed_type.startswith('image/'):
-                return MediaFormat.IMAGE
-            elif guessed_type.startswith('video/'):
-                return MediaFormat.VIDEO
-            elif guessed_type.startswith('audio/'):
-                return MediaFormat.AUDIO
     except (ValueError, TypeError):
-        # Failed to parse URL or determine format from URL - continue to fallback detection
-        pass
+        # Failed to parse URL or determine format from URL
+        return MediaFormat.UNKNOWN
 
+    if guessed_type:
+        return _TYPE_TO_FORMAT.get(guessed_type.partition('/')[0], MediaFormat.UNKNOWN)
     return MediaFormat.UNKNOWN
 
 
@@ -125,6 +136,7 @@ def can_display_inline(url: str, mimetype: Optional[str] = None) -> bool:
     return format_type == MediaFormat.IMAGE
 
 
+@lru_cache(maxsize=1024)
 def get_file_extension(url: str) -> str:
     """Extract file extension from URL.
 
@@ -134,7 +146,16 @@ def get_file_extension(url: str) -> str:
     Returns:
         File extension without dot
     """
-    try:
-        return Path(url).suffix.lower().lstrip('.')
-    except Exception:
-        return ""
+    return _ext(url)
+
+
+def _ext(url: str) -> str:
+    """Get the lowercase extension of the last path segment of a URL.
+
+    Plain string operations, without the Path parsing; the query string and
+    fragment are ignored.
+    """
+    path = url.split('?', 1)[0].split('#', 1)[0]
+    name = path.rpartition('/')[2]
+    stem, dot, extension = name.rpartition('.')
+    return extension.lower() if dot and stem else ""
@@ -3,7 +3,7 @@
 import asyncio
 import io
 import logging
-from typing import Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 from PIL import Image
@@ -13,6 +13,12 @@ from .formats import MediaFormat, get_media_format
 
 logger = logging.getLogger(__name__)
 
+MAX_MEDIA_SIZE = 50 * 1024 * 1024
+
+# Timelines show dozens of attachments per page, allow as many downloads
+MAX_DOWNLOADS = 16
+POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
 
 class MediaLoadError(Exception):
     """Exception raised when media loading fails."""
@@ -22,6 +28,12 @@ class MediaLoadError(Exception):
 class MediaLoader:
     """Handles async loading and processing of media files."""
 
+    # HTTP clients shared by all MediaLoader instances, keyed by timeout, and
+    # the number of loaders using each. A client is closed when its last
+    # loader exits.
+    _shared_clients: Dict[float, httpx.AsyncClient] = {}
+    _client_users: Dict[float, int] = {}
+
     def __init__(self, cache: MediaCache, timeout: int = 30):
         """Initialize media loader.
 
@@ -32,21 +44,50 @@ class MediaLoader:
         self.cache = cache
         self.timeout = timeout
         self._client: Optional[httpx.AsyncClient] = None
-        self._semaphore = asyncio.Semaphore(5)  # Limit concurrent downloads
+        self._semaphore = asyncio.Semaphore(MAX_DOWNLOADS)
+        # Thumbnails being generated, by URL and size
+        self._thumbnail_tasks: Dict[
+            Tuple[str, Tuple[int, int]], asyncio.Future[Optional[bytes]]
+        ] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.timeout),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        )
+        if not self._client:
+            self._client = self._acquire_client(self.timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self._client:
-            await self._client.aclose()
             self._client = None
+            await self._release_client(self.timeout)
+
+    @classmethod
+    def _acquire_client(cls, timeout: float) -> httpx.AsyncClient:
+        """Get the shared HTTP client for timeout, creating it if needed."""
+        client = cls._shared_clients.get(timeout)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(timeout),
+                limits=POOL_LIMITS,
+            )
+            cls._shared_clients[timeout] = client
+        cls._client_users[timeout] = cls._client_users.get(timeout, 0) + 1
+        return client
+
+    @classmethod
+    async def _release_client(cls, timeout: float) -> None:
+        """Stop using the shared HTTP client, closing it if it was the last user."""
+        users = cls._client_users.get(timeout, 0) - 1
+        if users > 0:
+            cls._client_users[timeout] = users
+            return
+
+        cls._client_users.pop(timeout, None)
+        client = cls._shared_clients.pop(timeout, None)
+        if client:
+            await client.aclose()
 
     async def load_media(
         self,
@@ -72,34 +113,53 @@ class MediaLoader:
         if cached_data:
             return cached_data
 
-        # Download if not cached
+        # Download and cache if not cached
         try:
-            async with self._semaphore:
-                data = await self._download_media(url)
-                if data:
-                    # Store in appropriate cache
-                    await self.cache.store_full_media(url, data)
-
-                    # Generate and cache thumbnail for images
-                    if prefer_thumbnail and self._is_image(url):
-                        thumbnail = await self._generate_thumbnail(data)
-                        if thumbnail:
-                            await self.cache.store_thumbnail(url, thumbnail)
-                            return thumbnail
-
-                    return data
+            data = await self.cache.fetch_full_media(url, self._stream_media)
+            if data:
+                # Generate and cache thumbnail for images
+                if prefer_thumbnail and self._is_image(url):
+                    thumbnail = await self._generate_thumbnail(data)
+                    if thumbnail:
+                        await self.cache.store_thumbnail(url, thumbnail)
+                        return thumbnail
+
+                return data
         except Exception as e:
             logger.warning(f"Failed to load media from {url}: {e}")
             raise MediaLoadError(f"Failed to load media: {e}") from e
 
         return None
 
-    async def load_thumbnail(self, url: str, size: Tuple[int, int] = (150, 150)) -> Optional[bytes]:
+    async def load_thumbnail(
+        self,
+        url: str,
+        size: Tuple[int, int] = (150, 150),
+        mimetype: Optional[str] = None,
+    ) -> Optional[bytes]:
         """Load or generate thumbnail for media.
 
         Args:
             url: Media URL
             size: Thumbnail size (width, height)
+            mimetype: MIME type or attachment type of the media, if known
+
+        Returns:
+            Thumbnail data or None
+        """
+        if not self._is_image(url, mimetype):
+            return None
+
+        return await self._load_image_thumbnail(url, size)
+
+    async def _load_image_thumbnail(
+        self, url: str, size: Tuple[int, int] = (150, 150)
+    ) -> Optional[bytes]:
+        """Load or generate thumbnail for a URL already known to be an image.
+
+        Args:
+            url: Image URL
+            size: Thumbnail size (width, height)
 
         Returns:
             Thumbnail data or None
@@ -109,54 +169,76 @@ class MediaLoader:
         if cached_thumbnail:
             return cached_thumbnail
 
-        # Check if we have full media cached
-        cached_media = await self.cache.get_full_media(url)
-        if cached_media and self._is_image(url):
-            thumbnail = await self._generate_thumbnail(cached_media, size)
-            if thumbnail:
-                await self.cache.store_thumbnail(url, thumbnail)
-                return thumbnail
+        # Share thumbnail generation between concurrent requests
+        key = (url, size)
+        task = self._thumbnail_tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._create_thumbnail(url, size))
+            self._thumbnail_tasks[key] = task
+            task.add_done_callback(lambda _: self._thumbnail_tasks.pop(key, None))
+
+        # Shield the shared task, so a cancelled caller doesn't cancel it for
+        # the others
+        return await asyncio.shield(task)
 
-        # Download and generate thumbnail
+    async def _create_thumbnail(self, url: str, size: Tuple[int, int]) -> Optional[bytes]:
+        """Generate and cache a thumbnail from cached or downloaded media.
+
+        Args:
+            url: Image URL
+            size: Thumbnail size (width, height)
+
+        Returns:
+            Thumbnail data or None
+        """
         try:
-            async with self._semaphore:
-                data = await self._download_media(url)
-                if data and self._is_image(url):
-                    # Store full media
-                    await self.cache.store_full_media(url, data)
-
-                    # Generate thumbnail
-                    thumbnail = await self._generate_thumbnail(data, size)
-                    if thumbnail:
-                        await self.cache.store_thumbnail(url, thumbnail)
-                        return thumbnail
+            data = await self.cache.get_full_media(url)
+            if not data:
+                data = await self.cache.fetch_full_media(url, self._stream_media)
         except Exception as e:
             logger.warning(f"Failed to load thumbnail from {url}: {e}")
+            return None
+
+        if data:
+            thumbnail = await self._generate_thumbnail(data, size)
+            if thumbnail:
+                await self.cache.store_thumbnail(url, thumbnail)
+                return thumbnail
 
         return None
 
-    async def _download_media(self, url: str) -> Optional[bytes]:
-        """Download media from URL.
+    async def _stream_media(self, url: str) -> AsyncIterator[bytes]:
+        """Download media from URL, in chunks as they arrive.
+
+        The number of concurrent downloads is limited.
 
         Args:
             url: Media URL
 
-        Returns:
-            Media data or None
+        Yields:
+            Chunks of media data
         """
         if not self._client:
             raise MediaLoadError("HTTP client not initialized")
 
         try:
-            response = await self._client.get(url)
-            response.raise_for_status()
-
-            # Check content length
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > 50 * 1024 * 1024:  # 50MB limit
-                raise MediaLoadError("Media file too large")
-
-            return response.content
+            async with self._semaphore, self._client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # Check content length
+                content_length = response.headers.get('content-length')
+                if content_length and int(content_length) > MAX_MEDIA_SIZE:
+                    raise MediaLoadError("Media file too large")
+
+                # Take chunks as they come off the connection; asking for a
+                # fixed chunk size would re-buffer and copy every byte
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    # The header may be missing or wrong
+                    size += len(chunk)
+                    if size > MAX_MEDIA_SIZE:
+                        raise MediaLoadError("Media file too large")
+                    yield chunk
 
         except httpx.HTTPError as e:
             raise MediaLoadError(f"HTTP error: {e}") from e
@@ -202,51 +284,57 @@ class MediaLoader:
             Thumbnail data
         """
         with Image.open(io.BytesIO(image_data)) as img:
-            # Convert to RGB if necessary
-            if img.mode in ('RGBA', 'LA', 'P'):
+            # Let JPEGs decode straight at a reduced scale, rather than at
+            # full resolution
+            img.draft('RGB', (size[0] * 2, size[1] * 2))
+
+            # Palette images can only be resized with nearest neighbour, and
+            # other uncommon modes not at all
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'CMYK'):
                 img = img.convert('RGB')
 
-            # Generate thumbnail maintaining aspect ratio
-            img.thumbnail(size, Image.Resampling.LANCZOS)
+            # Generate thumbnail maintaining aspect ratio. The reducing gap
+            # shrinks large images by a fast integer factor first.
+            img.thumbnail(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+            # Convert the thumbnail, not the full image, for JPEG
+            if img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
 
             # Save as JPEG
             output = io.BytesIO()
-            img.save(output, format='JPEG', quality=85, optimize=True)
+            img.save(output, format='JPEG', quality=85)
             return output.getvalue()
 
-    def _is_image(self, url: str) -> bool:
+    def _is_image(self, url: str, mimetype: Optional[str] = None) -> bool:
         """Check if URL points to an image.
 
         Args:
             url: Media URL
+            mimetype: MIME type or attachment type of the media, if known
 
         Returns:
             True if URL is an image
         """
-        return get_media_format(url) == MediaFormat.IMAGE
+        return get_media_format(url, mimetype) == MediaFormat.IMAGE
+
+    async def preload_media(self, image_urls: List[str]) -> None:
+        """Preload thumbnails for multiple images.
 
-    async def preload_media(self, urls: list[str]) -> None:
-        """Preload multiple media files.
+        Other media is only loaded on demand, so there is nothing to warm for
+        it; callers classify the URLs and pass only images, which are not
+        checked again.
 
         Args:
-            urls: List of media URLs to preload
+            image_urls: List of image URLs to preload
         """
-        tasks = []
-        for url in urls:
-            if self._is_image(url):
-                # Preload thumbnails for images
-                task = asyncio.create_task(self.load_thumbnail(url))
-            else:
-                # Just check cache for non-images
-                task = asyncio.create_task(self.cache.get_full_media(url))
-            tasks.append(task)
+        tasks = [asyncio.create_task(self._load_image_thumbnail(url)) for url in image_urls]
 
         if tasks:
-            # Wait for all preload tasks with timeout
-            try:
-                await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=10.0
-                )
-            except asyncio.TimeoutError:
+            # Wait for all preload tasks with timeout, without wrapping them in
+            # a gather and a wait_for task of their own
+            _, pending = await asyncio.wait(tasks, timeout=10.0)
+            if pending:
                 logger.debug("Media preload timed out")
+                for task in pending:
+                    task.cancel()
@@ -7,8 +7,8 @@ from typing import Any, Dict, List, Optional
 from textual.widget import Widget
 
 from .cache import MediaCache
-from .external import ExternalViewerManager
-from .formats import get_media_format, is_supported_format
+from .external import VIEWER_TYPES, ExternalViewerManager
+from .formats import MediaFormat, get_media_format, is_supported_format
 from .loader import MediaLoader
 from .renderer import MediaRenderer
 
@@ -25,8 +25,10 @@ class MediaManager:
             config: MediaConfig object or Tootles configuration object
         """
         self.config = config
-        # Handle both MediaConfig directly and config.media
-        media_config = config if hasattr(config, 'memory_cache_size') else config.media
+        # Handle both MediaConfig directly and config.media, once rather than
+        # on every media request
+        self.media_config = config if hasattr(config, 'memory_cache_size') else config.media
+        media_config = self.media_config
 
         self.cache = MediaCache(
             memory_cache_mb=media_config.memory_cache_size,
@@ -67,8 +69,7 @@ class MediaManager:
         Returns:
             Widget for displaying media
         """
-        media_config = self.config if hasattr(self.config, 'memory_cache_size') else self.config.media
-        if not media_config.show_media_previews:
+        if not self.media_config.show_media_previews:
             return self._create_disabled_placeholder(attachment)
 
         if not is_supported_format(attachment.url, attachment.type):
@@ -79,7 +80,9 @@ class MediaManager:
             try:
                 loader = await self._get_loader()
                 if size == "thumbnail":
-                    media_data = await loader.load_thumbnail(attachment.url)
+                    media_data = await loader.load_thumbnail(
+                        attachment.url, mimetype=attachment.type
+                    )
                 else:
                     media_data = await loader.load_media(attachment.url, prefer_thumbnail=False)
             except Exception as e:
@@ -93,15 +96,18 @@ class MediaManager:
         Args:
             attachments: List of MediaAttachment objects
         """
-        media_config = self.config if hasattr(self.config, 'memory_cache_size') else self.config.media
-        if not media_config.show_media_previews or not attachments:
+        if not self.media_config.show_media_previews or not attachments:
             return
 
         try:
             loader = await self._get_loader()
-            urls = [att.url for att in attachments if is_supported_format(att.url, att.type)]
-            if urls:
-                await loader.preload_media(urls)
+            # Classify each attachment once; only images are preloaded
+            image_urls = [
+                att.url for att in attachments
+                if get_media_format(att.url, att.type) == MediaFormat.IMAGE
+            ]
+            if image_urls:
+                await loader.preload_media(image_urls)
         except Exception as e:
             logger.debug(f"Failed to preload media: {e}")
 
@@ -185,8 +191,8 @@ class MediaManager:
         Returns:
             True if external viewer is available
         """
-        media_format = get_media_format(attachment.url, attachment.type)
-        return self.external_viewer.is_viewer_available(media_format.value)
+        media_type = VIEWER_TYPES.get(get_media_format(attachment.url, attachment.type))
+        return media_type is not None and self.external_viewer.is_viewer_available(media_type)
 
     def _create_disabled_placeholder(self, attachment) -> Widget:
         """Create placeholder when media previews are disabled.
@@ -216,8 +222,14 @@ class MediaManager:
         """
         # This would be enhanced with actual cache statistics
         return {
-            "memory_cache_size": self.cache.memory_cache.current_size,
-            "memory_cache_items": len(self.cache.memory_cache.cache),
+            "memory_cache_size": (
+                self.cache.memory_cache.current_size
+                + self.cache.thumbnail_cache.current_size
+            ),
+            "memory_cache_items": (
+                len(self.cache.memory_cache.cache)
+                + len(self.cache.thumbnail_cache.cache)
+            ),
             "disk_cache_available": True,
             "external_viewers": self.external_viewer.get_available_viewers()
         }
@@ -229,6 +241,7 @@ class MediaManager:
             self._loader = None
 
         self.external_viewer.cleanup_temp_files()
+        self.cache.close()
 
     async def __aenter__(self):
         """Async context manager entry."""
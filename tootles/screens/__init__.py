@@ -1 +1,18 @@
 """Screen modules for Tootles."""
+
+from tootles._lazy import lazy_exports
+
+_LAZY = {
+    "BaseScreen": ".base",
+    "AccountScreen": ".account",
+    "ExploreScreen": ".explore",
+    "HelpScreen": ".help",
+    "HomeScreen": ".home",
+    "NotificationsScreen": ".notifications",
+    "SettingsScreen": ".settings",
+}
+
+__all__ = list(_LAZY)
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -92,7 +92,7 @@ class HomeScreen(BaseScreen):
 
         try:
             if direction == "newer":
-                return await self.client.get_home_timeline(since_id=cursor_id, limit=20)
+                return await self.client.get_home_timeline(min_id=cursor_id, limit=20)
             else:
                 return await self.client.get_home_timeline(max_id=cursor_id, limit=20)
         except Exception as e:
@@ -1,7 +1,14 @@
 """Widget package for Tootles UI components."""
 
-from .compose import ComposeWidget
-from .status import StatusWidget
-from .timeline import TimelineWidget
+from tootles._lazy import lazy_exports
+
+_LAZY = {
+    "ComposeWidget": ".compose",
+    "StatusWidget": ".status",
+    "TimelineWidget": ".timeline",
+}
 
 __all__ = ["StatusWidget", "TimelineWidget", "ComposeWidget"]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY)
@@ -16,6 +16,10 @@ from .status import StatusWidget
 class Timeline(Widget):
     """A scrollable timeline widget for displaying statuses."""
 
+    # Statuses kept in the timeline. Loading past this drops statuses from the
+    # opposite end, which can be loaded again by paging back.
+    MAX_STATUSES = 200
+
     DEFAULT_CSS = """
     Timeline {
         height: 1fr;
@@ -81,6 +85,7 @@ class Timeline(Widget):
 
     def compose(self) -> ComposeResult:
         """Compose the timeline layout."""
+        self._status_widgets.clear()
         with VerticalScroll():
             if self._loading:
                 yield Label("Loading...", classes="loading-message")
@@ -109,8 +114,8 @@ class Timeline(Widget):
             prepend: Whether to prepend (True) or replace (False) existing statuses
         """
         if prepend:
-            # Add new statuses to the beginning
-            self._statuses = statuses + self._statuses
+            # Add new statuses to the beginning, dropping the oldest
+            self._statuses = (statuses + self._statuses)[:self.MAX_STATUSES]
         else:
             # Replace all statuses
             self._statuses = statuses
@@ -126,10 +131,8 @@ class Timeline(Widget):
         """
         self._statuses.extend(statuses)
 
-        # Add new status widgets
-        for status in statuses:
-            status_widget = StatusWidget(status, self.app_ref, media_manager=self.media_manager)
-            self._status_widgets.append(status_widget)
+        # Drop the newest statuses, loading newer ones brings them back
+        del self._statuses[:-self.MAX_STATUSES]
 
         self.refresh(recompose=True)
 
@@ -220,7 +223,9 @@ class TimelineWidget(Widget):
             app_ref: Reference to the main application.
             statuses: Initial list of statuses to display.
             empty_message: Message to show when timeline is empty.
-            load_callback: Async callback for loading more statuses.
+            load_callback: Async callback for loading more statuses, called
+                with a direction ("newer" or "older", or the timeline type
+                for the first page) and the ID of the status to page from.
             timeline_type: The type of timeline to load.
             search_query: The search query for search timelines.
             media_manager: MediaManager instance for handling media previews.
@@ -271,16 +276,14 @@ class TimelineWidget(Widget):
         try:
             self._timeline.set_loading(True)
 
+            # The callback pages newer statuses from the cursor up with
+            # min_id, so statuses trimmed from the newest end come back
             if event.direction == "newer":
-                max_id = None
-                since_id = self._timeline.get_newest_id()
+                cursor_id = self._timeline.get_newest_id()
             else:  # older
-                max_id = self._timeline.get_oldest_id()
-                since_id = None
+                cursor_id = self._timeline.get_oldest_id()
 
-            new_statuses = await self._load_callback(
-                event.direction, max_id or since_id
-            )
+            new_statuses = await self._load_callback(event.direction, cursor_id)
 
             if new_statuses:
                 if event.direction == "newer":